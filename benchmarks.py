@@ -0,0 +1,114 @@
+"""
+Benchmarks of the simulation.
+Run it from the folder of the program: python benchmarks.py
+"""
+
+import json
+import os
+import shutil
+import time
+import tracemalloc
+
+from modules import var
+from modules.creature import Herbivore
+from modules.map import Map
+from modules.world import World
+
+BLOCK_TICKS = 1000  # ticks timed together
+MAP_NAME = 'benchmark'  # map created for the benchmarks, if it does not exist
+
+
+class SetupWorld(World):
+    """
+    World which is only set up, without running the simulation
+    """
+
+    def run(self):
+        pass
+
+
+def setup_world(name, template='just_herbivores', **variables):
+    """
+    Creates a world from a simulation template on the benchmark map, without running it
+
+    :param name: name of the simulation
+    :type name: str
+    :param template: name of the template
+    :type template: str
+    :param variables: variables to change in the template
+    :return: the world
+    """
+    if not os.path.exists(os.path.join(var.MAPS_PATH, MAP_NAME)):
+        with open(os.path.join(var.MAPS_TEMPLATES_PATH, f"default.{var.FILE_EXTENSIONS['map_template']}")) as file:
+            Map(MAP_NAME, json.loads(file.readline())).generate()
+    with open(os.path.join(var.SIMS_TEMPLATES_PATH, f"{template}.{var.FILE_EXTENSIONS['simulation_template']}")) as file:
+        sim_variables = json.loads(file.readline())
+    sim_variables['map_name'] = MAP_NAME
+    sim_variables.update(variables)
+    return SetupWorld(name, sim_variables)
+
+
+def live_set_benchmark(blocks=5, **variables):
+    """
+    Times World._update in blocks of ticks of a real simulation, while the creatures ever lived grow,
+    so that the archive of the dead creatures and the store of the trajectories are in the ticks timed.
+    The time of a tick for every live creature must not grow with the history
+
+    :param blocks: number of blocks of BLOCK_TICKS ticks
+    :type blocks: int
+    :param variables: variables to change in the template
+    :return: the list of the average times of a tick for every live creature of every block
+    """
+    name = 'live_set_benchmark'
+    world = setup_world(name, max_lifetime=blocks * BLOCK_TICKS, **variables)
+    world.start_time = time.time()
+    times = list()
+    for block in range(blocks):
+        total = 0
+        alive = 0
+        for tick in range(BLOCK_TICKS):
+            alive += len(world.alive_creatures)
+            start = time.perf_counter()
+            world._update()
+            total += time.perf_counter() - start
+            if not world.alive_creatures:
+                break
+        times.append(total / max(alive, 1))
+        print(f'ticks {block * BLOCK_TICKS}-{world.tick_count}  -  lived: {world.ID_count}  -  '
+              f'alive: {len(world.alive_creatures)}  -  {total / (tick + 1) * 1e3:.2f} ms per tick  -  '
+              f'{times[-1] * 1e6:.2f} us per live creature')
+        if not world.alive_creatures:
+            break
+    print(f'last block / first block: {times[-1] / times[0]:.2f}')
+    world.lifetime = world.tick_count
+    world._end()
+    shutil.rmtree(world.path)
+    return times
+
+
+def memory_benchmark(creatures=10000):
+    """
+    Measures the memory allocated for every initial creature, with its genes
+
+    :param creatures: number of creatures created
+    :type creatures: int
+    :return: the bytes per creature
+    """
+    name = 'memory_benchmark'
+    world = setup_world(name, initial_creatures={'herbivores': 0, 'carnivores': 0})
+    tracemalloc.start()
+    start = tracemalloc.take_snapshot()
+    world._population_new(Herbivore, creatures)
+    end = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in end.compare_to(start, 'filename')) / creatures
+    print(f'{creatures} creatures  -  {size:.0f} bytes per creature')
+    shutil.rmtree(world.path)
+    return size
+
+
+if __name__ == '__main__':
+    print('live set maintenance')
+    live_set_benchmark()
+    print('memory')
+    memory_benchmark()
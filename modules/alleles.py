@@ -8,9 +8,11 @@ RECESSIVE = 0
 
 class Allele(object):
     """
-    class of alleles
+    class of alleles. The alleles are immutable, so every gene class shares one object for every allele
     """
-    def __init__(self, value, dominance):
+    __slots__ = ('value', 'dominance', 'index')
+
+    def __init__(self, value, dominance, index=None):
         """
         creates a new allele
 
@@ -18,9 +20,12 @@ class Allele(object):
         :type value: str
         :param dominance: allele dominance: 0 if recessive, 1 if dominant
         :type dominance: int
+        :param index: the position of the allele in the ALLELE_OBJECTS of its gene class
+        :type index: int
         """
         self.value = value
         self.dominance = dominance
+        self.index = index
 
     def is_dominant(self):
         """
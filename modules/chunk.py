@@ -1,9 +1,13 @@
 """
 this modulo contains the class Chunk which controls all the functions and variable of
-every portion of the world (quantity of food, temperature, growth of the food, etc.)
+every portion of the world (quantity of food, temperature, growth of the food, etc.).
+The values are stored in the chunk grid of the World and a Chunk object is a view on it.
+It contains also the class TempDeathTable of the probabilities to die for the temperature of every chunk
 """
 
-from random import random
+import math
+
+import numpy
 
 from . import utility as utl
 from . import var
@@ -13,44 +17,49 @@ class Chunk:
     """
     chunk class
     """
+    __slots__ = ('coord', 'world', 'chunk_creature_set')
 
-    def __init__(self, world, x, y, foodmax, temperature):
+    def __init__(self, world, x, y):
         """
         Creates a new chunk object given the coords
 
         :param world: world object where the chunk is
         :type world: World
-        :param coord: tuple with the coordinates of the chunk
-        :type coord: tuple
+        :param x: first coordinate of the chunk
+        :type x: int
+        :param y: second coordinate of the chunk
+        :type y: int
         """
         self.coord = (x, y)
-        # food
         self.world = world
-        self.foodmax = foodmax
-        self.temperature = temperature
-        self.food = self.foodmax * random() * self.world.chunks_vars['start_food']
-        self.growth_rate = self.foodmax * self.world.chunks_vars['growth_coeff']
-        self.food_history = list()
         self.chunk_creature_set = set()
-        self.ticks_record = list()
 
-    def update(self, tick_to_record):
-        """
-        Updates the parameters of the chunk
+    @property
+    def food(self):
+        world = self.world
+        food = world.food.item(self.coord)
+        if world.lazy_growth:
+            # closed form of the growth since the last change, as World.food_now
+            delta = world.growth_tick - world.food_tick.item(self.coord)
+            food = min(world.foodmax.item(self.coord), food * math.exp(min(delta * math.log1p(world.growth_rate.item(self.coord)), 700)))
+        return food
 
-        :return:
-        """
-        self.food *= (1 + self.growth_rate)  # ad ogni ciclo l'erba cresce
-        if self.food > self.foodmax:  # finche' non raggiunge il massimo
-            self.food = self.foodmax
+    @food.setter
+    def food(self, value):
+        self.world.food[self.coord] = value
+        self.world.food_tick[self.coord] = self.world.growth_tick
 
-        self.food_history.append((int(self.food),))
+    @property
+    def foodmax(self):
+        return self.world.foodmax.item(self.coord)
 
-        if tick_to_record:
-            self.tick_record()
+    @property
+    def growth_rate(self):
+        return self.world.growth_rate.item(self.coord)
 
-    def tick_record(self):
-        self.ticks_record.append(self.chunk_creature_set.copy())
+    @property
+    def temperature(self):
+        return self.world.temperature.item(self.coord)
 
     def end(self, file):
         """
@@ -61,5 +70,63 @@ class Chunk:
         """
         to_write = str()
         for i in var.TO_RECORD['chunk']:
-            to_write += utl.add_to_write(self.__dict__[i], self.world.analysis['rounding'])
+            to_write += utl.add_to_write(getattr(self, i), self.world.analysis['rounding'])
         file.write(to_write[:-1] + '\n')
+
+
+class TempDeathTable(object):
+    """
+    class of the probabilities to die for the temperature in every chunk, for every temp_resist phenotype
+    """
+    PHENOTYPES = ('N', 'n', 'c', 'l')
+
+    def __init__(self, world):
+        """
+        Builds the table from the temperatures of the world
+
+        :param world: world object of the chunks
+        :type world: World
+        """
+        self.world = world
+        self.version = None  # World.temperature_version of the table
+        self.prob = dict()
+        self.update()
+
+    def update(self):
+        """
+        Builds the table again if the temperatures of the world have been set since the last time
+
+        :return:
+        """
+        if self.version == self.world.temperature_version:
+            return
+        self.version = self.world.temperature_version
+        temperature = self.world.temperature
+        temp_max = self.world.map_maxes['temperature']
+        coeff = self.world.creatures_vars['temp_death_prob_coeff']
+        # same formulas of Creature._death_prob_temp
+        rel_temp = temperature / (2 * temp_max)
+        self.prob['c'] = (rel_temp * (rel_temp - 1) + (1 / 4)) * coeff
+        self.prob['l'] = (rel_temp * (1 + rel_temp) + (1 / 4)) * coeff
+        self.prob['N'] = ((temperature ** 2) / (temp_max ** 2)) * coeff
+        self.prob['n'] = self.prob['N']
+
+    def get(self, temp_resist, x, y):
+        """
+        Gets the probability to die in the chunks (x, y) with the temp_resist phenotype given
+
+        :param temp_resist: the phenotype, or the array of the phenotypes of many creatures
+        :type temp_resist: str
+        :param x: the first coordinate of the chunk, or the array of the ones of many creatures
+        :type x: int
+        :param y: the second coordinate of the chunk, or the array of the ones of many creatures
+        :type y: int
+        :return: the probability, or the array of the probabilities
+        """
+        if isinstance(temp_resist, str):
+            return self.prob[temp_resist].item(x, y)
+        prob = numpy.empty(len(temp_resist))
+        for phenotype in self.PHENOTYPES:
+            mask = temp_resist == phenotype
+            prob[mask] = self.prob[phenotype][x[mask], y[mask]]
+        return prob
@@ -4,8 +4,8 @@ It controls all the functions and variables of each creature (eating, moving, re
 """
 
 import math
-import random
-from random import random as rnd
+
+import numpy
 
 from . import utility as utl
 from . import var
@@ -14,6 +14,9 @@ from . import var
 class Creature(object):
     """class of creatures"""
     TO_RECORD_ = var.TO_RECORD['creature']
+    __slots__ = ('world', 'ID', 'coord', 'parents_ID', 'birth_tick', 'energy', '_reprod_ready',
+                 'death_date', 'fertile', 'old', 'dest_chunk', 'dest_coord', 'sex', 'diet', 'death_tick', 'death_cause',
+                 'genes', 'events')
 
     def __init__(self, world, start_coord, parents_ID, energy, sex, genes, start_count=0):
         """
@@ -38,27 +41,36 @@ class Creature(object):
         self.ID = self.world.get_ID()
         self.coord = start_coord  # creature's starting coord definition
         self.parents_ID = parents_ID
-        self.tick_history = list()
         self.birth_tick = self.world.tick_count - start_count  # creature's creation tick definition (startCount is used only during diversification at start)
         self.energy = energy  # creature's starting energy definition
-        self._actual_chunk().chunk_creature_set.add(self)  # creature's adding to the list of creatures in its chunk
-        self.reprod_ready = False  # reproduction capacity set to false
-        self.death_date = int(random.gauss(self.world.creatures_vars['average_age'], self.world.creatures_vars[
+        self._reprod_ready = False  # reproduction capacity set to false
+        self.death_date = int(self.world.rng['death'].gauss(self.world.creatures_vars['average_age'], self.world.creatures_vars[
             'dev_age_prob']))  # crearture's age of death definition
-        self.age = 0  # age set to 0
+        self.fertile = False  # set by the scheduler of the world when the reproduction countdown expires
+        self.old = False  # set by the scheduler of the world when the creature reaches its age of death
         self.dest_chunk = [self.chunk_coord(0), self.chunk_coord(1)]
         self.sex = sex
         self.diet = self.DIET
+        self._actual_chunk().chunk_creature_set.add(self)  # creature's adding to the list of creatures in its chunk
+        self.world.spatial_index.add(self, *self.dest_chunk)
         self.death_tick = None
         self.death_cause = None
 
         # creature's genes definition
         self.genes = genes
-        self.reprod_countdown = self.genes['fertility'].get() + self.world.creatures_vars['initial_reprod_countdown'] - start_count
+        reprod_countdown = self.genes['fertility'].get() + self.world.creatures_vars['initial_reprod_countdown'] - start_count
+        # the countdown decreases by one every tick until it expires, the age increases by one every tick
+        # the events are cancelled at the death, so that the calendar holds only live creatures
+        self.events = (self.world.scheduler.schedule(self.world.tick_count + max(1, math.ceil(reprod_countdown) + 1), self._fertile_set),
+                       self.world.scheduler.schedule(self.world.tick_count + max(1, self.death_date), self._old_set))
         # phenotypical characteristics valuation
 
         self.world.new_born.add(self)  # creature's adding to the list of creatures
 
+    def __hash__(self):
+        # the order of the sets of creatures depends only on the simulation
+        return self.ID
+
     def death(self, cause="e"):
         """
         Kills the creature
@@ -70,9 +82,35 @@ class Creature(object):
         """
         self.death_tick = self.world.tick_count
         self.death_cause = cause
+        for event in self.events:
+            self.world.scheduler.cancel(event)
         self._actual_chunk().chunk_creature_set.remove(self)
+        self.world.spatial_index.remove(self, self.chunk_coord(0), self.chunk_coord(1))
+        if self._reprod_ready:
+            self.world.mate_registry.remove(self, self.chunk_coord(0), self.chunk_coord(1))
         self.world.tick_dead.add(self)
 
+    @property
+    def tick_history(self):
+        return self.world.trajectories.history(self.ID)
+
+    @property
+    def reprod_ready(self):
+        return self._reprod_ready
+
+    @reprod_ready.setter
+    def reprod_ready(self, ready):
+        """
+        Sets the reproduction readiness and keeps the spatial index and the mate registry of the world up to date
+        """
+        if ready != self._reprod_ready:
+            self.world.spatial_index.ready_set(self, self.chunk_coord(0), self.chunk_coord(1), ready)
+            if ready:
+                self.world.mate_registry.add(self, self.chunk_coord(0), self.chunk_coord(1))
+            else:
+                self.world.mate_registry.remove(self, self.chunk_coord(0), self.chunk_coord(1))
+            self._reprod_ready = ready
+
     def update(self):
         """
         Updates the creature status
@@ -80,12 +118,11 @@ class Creature(object):
         :return:
         """
         # reproduction control
-        if self.energy > (self.world.creatures_vars['reprod_energy_need_coeff'] / self.genes['fertility'].get()) and self.reprod_countdown <= 0:
+        if self.fertile and self.energy > (self.world.creatures_vars['reprod_energy_need_coeff'] / self.genes['fertility'].get()):
             self.reprod_ready = True
             self._dating_agency()
         else:
             self.reprod_ready = False
-            self.reprod_countdown -= 1
 
         # food search
         self._dest_calc()
@@ -98,13 +135,28 @@ class Creature(object):
 
         # creature's variables update
         self.energy -= self.world.creatures_vars['en_dec_coeff'] * self.energy  # energy decrease every tick
-        self.age += 1
 
         # death control
-        self.tick_history.append(
-            (round(self.coord[0], 2), round(self.coord[1], 2), int(self.energy), int(self.reprod_ready)))
+        if self.world.recorded['trajectories']:
+            self.world.trajectories.record(self.ID, self.coord[0], self.coord[1], self.energy, self.reprod_ready)
         self._death_control()
 
+    def _fertile_set(self):
+        """
+        Makes the creature able to reproduce when its reproduction countdown expires
+
+        :return:
+        """
+        self.fertile = True
+
+    def _old_set(self):
+        """
+        Makes the creature die by age at the end of the tick
+
+        :return:
+        """
+        self.old = True
+
     def _actual_chunk(self):
         """
         Gets the Chunk object in which the creature is
@@ -124,11 +176,11 @@ class Creature(object):
             self.world.tick_dead.add(self)
             self.death("s")
 
-        elif rnd() <= self._death_prob_temp():  # temperature death
+        elif self.world.rng['death'].random() <= self._death_prob_temp():  # temperature death
             self.world.tick_dead.add(self)
             self.death("t")
 
-        elif self.age >= self.death_date:  # death by age
+        elif self.old:  # death by age
             self.world.tick_dead.add(self)
             self.death("a")
 
@@ -138,19 +190,7 @@ class Creature(object):
         
         :return: the probablity to die for temperature reasons
         """
-        temp_resist = self.genes['temp_resist'].get()
-        chunk_temp = self._actual_chunk().temperature
-        temp_max = self.world.map_maxes['temperature']
-        if temp_resist == 'c':
-            rel_temp = chunk_temp / (2 * temp_max)
-            prob = (rel_temp * (rel_temp - 1) + (1 / 4))
-        elif temp_resist == 'l':
-            rel_temp = chunk_temp / (2 * temp_max)
-            prob = (rel_temp * (1 + rel_temp) + (1 / 4))
-        elif temp_resist == 'N' or temp_resist == 'n':
-            prob = ((chunk_temp ** 2) / (temp_max ** 2))
-
-        return prob * self.world.creatures_vars['temp_death_prob_coeff']
+        return self.world.temp_death_table.get(self.genes['temp_resist'].get(), self.chunk_coord(0), self.chunk_coord(1))
 
     def _dest_calc(self):
         """
@@ -178,12 +218,12 @@ class Creature(object):
 
     def _step(self):
         """
-        Makes the creature move towards dest_coord and adds it to the chunk set
+        Makes the creature move towards dest_coord and moves it to the new chunk set if it leaves its chunk
         
         :return:
         """
 
-        self._actual_chunk().chunk_creature_set.remove(self)
+        old_chunk = (self.chunk_coord(0), self.chunk_coord(1))
 
         speed = self.genes['speed'].get()
         self.coord[0] += (self.dest_coord[0] - self.coord[0]) / math.sqrt((self.dest_coord[0] - self.coord[0]) ** 2 + (
@@ -191,7 +231,13 @@ class Creature(object):
         self.coord[1] += (self.dest_coord[1] - self.coord[1]) / math.sqrt(
             (self.dest_coord[0] - self.coord[0]) ** 2 + (self.dest_coord[1] - self.coord[1]) ** 2) * speed
 
-        self._actual_chunk().chunk_creature_set.add(self)
+        new_chunk = (self.chunk_coord(0), self.chunk_coord(1))
+        if new_chunk != old_chunk:
+            self.world.chunk_list[old_chunk[0]][old_chunk[1]].chunk_creature_set.remove(self)
+            self._actual_chunk().chunk_creature_set.add(self)
+            self.world.spatial_index.move(self, old_chunk, new_chunk)
+            if self._reprod_ready:
+                self.world.mate_registry.move(self, old_chunk, new_chunk)
 
     def _eat(self):
         """
@@ -219,16 +265,14 @@ class Creature(object):
         """
         x = self.chunk_coord(0)
         y = self.chunk_coord(1)
-        for i in range(max(x - self.world.creatures_vars['view_ray'], 0),
-                       min(x + self.world.creatures_vars['view_ray'] + 1, self.world.dimension['width'])):
-            for j in range(max(y - self.world.creatures_vars['view_ray'], 0),
-                           min(y + self.world.creatures_vars['view_ray'] + 1, self.world.dimension['height'])):
-                for creature in self.world.chunk_list[i][j].chunk_creature_set:
-                    if creature.reprod_ready and creature.sex != self.sex and type(self) == type(creature):
-                        self._reproduction(creature)
-                        self.reprod_ready = False
-                        creature.reprod_ready = False
-                        return
+        # first chunk in the view with a ready mate
+        chunk = self.world.spatial_index.first(x, y, self.world.creatures_vars['view_ray'], diet=self.diet, sex=1 - self.sex, ready=True)
+        if chunk is None:
+            return
+        creature = self.world.mate_registry.first(chunk[0], chunk[1], self.diet, 1 - self.sex)
+        self._reproduction(creature)
+        self.reprod_ready = False
+        creature.reprod_ready = False
 
     def _reproduction(self, other):
         """
@@ -240,25 +284,26 @@ class Creature(object):
         """
         genes = dict()
         start_coord = [((self.coord[i] + other.coord[i]) / 2) for i in range(2)]
-        sex = int(rnd() * 2)
+        sex = int(self.world.rng['birth'].random() * 2)
         energy = (self.energy + other.energy) / 2
-        for i in self.genes:
-            genes[i] = self.genes[i].reproduce(other.genes[i], self.world.creatures_vars['mutation_coeff'])
+        for i in var.CREATURES_GENES:
+            genes[i] = self.genes[i].reproduce(other.genes[i], self.world.creatures_vars['mutation_coeff'], self.world.rng['birth'])
+        for i, cls in var.CREATURES_SECONDARY_GENES.items():
+            # from the genes of the child, as Genome.genes does
+            genes[i] = cls({j: genes[j] for j in cls.GENOTYPE})
         type(self)(self.world, start_coord, (self.ID, other.ID), energy, sex, genes)
         self.energy *= self.world.creatures_vars['reprod_energy_dec_coeff']
         other.energy *= self.world.creatures_vars['reprod_energy_dec_coeff']
 
-    def end(self, file):
+    def end(self):
         """
-        Saves the data of the creature at the end of the simulation
+        Gets the data of the creature to save after its death, as strings in the order of the file.
+        The states of the ticks recorded are left as None, they are taken from the TrajectoryStore when written
 
-        :param file: the file to write to
-        :return:
+        :return: the list of the strings
         """
-        to_write = str()
-        for i in self.TO_RECORD_:
-            to_write += utl.add_to_write(self.__dict__[i], self.world.analysis['rounding'])
-        file.write(to_write[:-1] + '\n')
+        return [None if i == 'tick_history' else utl.add_to_write(getattr(self, i), self.world.analysis['rounding'])
+                for i in self.TO_RECORD_]
 
 
 class Herbivore(Creature):
@@ -266,6 +311,7 @@ class Herbivore(Creature):
     class of herbivores
     """
     DIET = 'H'
+    __slots__ = ('eaten',)
 
     def __init__(self, *args, **kwargs):
         """
@@ -291,28 +337,20 @@ class Herbivore(Creature):
 
         x = self.chunk_coord(0)
         y = self.chunk_coord(1)
-        maxEn = float("-inf")
-
-        for i in range(max(x - self.world.creatures_vars['view_ray'], 0),
-                       min(x + self.world.creatures_vars['view_ray'] + 1, self.world.dimension['width'])):
-            for j in range(max(y - self.world.creatures_vars['view_ray'], 0),
-                           min(y + self.world.creatures_vars['view_ray'] + 1, self.world.dimension['height'])):
-                for creature in self.world.chunk_list[i][j].chunk_creature_set:
-                    if type(creature) == Carnivore:
-                        try:
-                            self.dest_chunk = [2 * x - i, 2 * y - j]
-                        except IndexError:
-                            pass
-                        else:
-                            self.dest_coord = [(self.dest_chunk[0] + 0.5) * self.world.chunk_dim, (
-                                self.dest_chunk[1] + 0.5) * self.world.chunk_dim]
-                            return
-
-                if self.world.chunk_list[i][j].food * self.genes['bigness'].get() * self.world.creatures_vars[
-                    'eat_coeff'] * self.world.creatures_vars['en_inc_coeff'] - self._energy_consume(i, j) > maxEn:
-                    maxEn = self.world.chunk_list[i][j].food * self.genes['bigness'].get() * self.world.creatures_vars[
-                        'eat_coeff'] * self.world.creatures_vars['en_inc_coeff'] - self._energy_consume(i, j)
-                    self.dest_chunk = [i, j]
+
+        # runs away from the first chunk in the view with a carnivore
+        chunk = self.world.spatial_index.predator_map(self.world.creatures_vars['view_ray']).flee(x, y)
+        if chunk is not None:
+            self.dest_chunk = [2 * x - chunk[0], 2 * y - chunk[1]]
+            self.dest_coord = [(self.dest_chunk[0] + 0.5) * self.world.chunk_dim, (
+                self.dest_chunk[1] + 0.5) * self.world.chunk_dim]
+            return
+
+        dest_x, dest_y, found = self.world.view_kernel.food_dest(
+            self.world, numpy.array([x]), numpy.array([y]), numpy.array([self.coord[0]]), numpy.array([self.coord[1]]),
+            numpy.array([self.genes['bigness'].get()]), numpy.array([self.genes['speed'].get()]), numpy.array([self.energy]))
+        if found[0]:
+            self.dest_chunk = [int(dest_x[0]), int(dest_y[0])]
 
         self.dest_coord = [(self.dest_chunk[0] + 0.5) * self.world.chunk_dim, (
             self.dest_chunk[1] + 0.5) * self.world.chunk_dim]
@@ -333,6 +371,7 @@ class Carnivore(Creature):
     class of carnivores
     """
     DIET = 'C'
+    __slots__ = ('prey',)
 
     def __init__(self, *args, **kwargs):
         """
@@ -356,22 +395,18 @@ class Carnivore(Creature):
         x = self.chunk_coord(0)
         y = self.chunk_coord(1)
         self.prey = None
-
-        for i in range(max(x - self.world.creatures_vars['view_ray'], 0),
-                       min(x + self.world.creatures_vars['view_ray'] + 1, self.world.dimension['width'])):
-            for j in range(max(y - self.world.creatures_vars['view_ray'], 0),
-                           min(y + self.world.creatures_vars['view_ray'] + 1, self.world.dimension['height'])):
-
-                for creature in self.world.chunk_list[i][j].chunk_creature_set:
-                    try:
-                        if type(creature) == Herbivore and (self.prey.energy - self._energy_consume(*self.prey.coord)) < creature.energy:
-                            self.prey = creature
-                            self.dest_chunk = [i, j]
-                    except AttributeError:
-                        self.prey = creature
-                        self.dest_chunk = [i, j]
+        prey_value = float("-inf")  # energy of the prey net of the energy needed to reach it
+
+        # the best prey of every chunk in the view with herbivores
+        for i, j in self.world.spatial_index.nonempty(x, y, self.world.creatures_vars['view_ray'], diet=Herbivore.DIET):
+            creature = self.world.prey_index.prey(i, j)
+            if prey_value < creature.energy:
+                self.prey = creature
+                self.dest_chunk = [i, j]
+                prey_value = self.prey.energy - self._energy_consume(*self.prey.coord)
         if self.prey == None:
-            self.dest_chunk = [self.chunk_coord(0) + (-1 + int(rnd() * 2) * 2) * 6, self.chunk_coord(1) + (-1 + int(rnd() * 2) * 2) * 6]
+            rng = self.world.rng['movement']
+            self.dest_chunk = [self.chunk_coord(0) + (-1 + int(rng.random() * 2) * 2) * 6, self.chunk_coord(1) + (-1 + int(rng.random() * 2) * 2) * 6]
         self.dest_coord = [(self.dest_chunk[0] + 0.5) * self.world.chunk_dim, (self.dest_chunk[1] + 0.5) * self.world.chunk_dim]
 
     def _eat(self):
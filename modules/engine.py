@@ -0,0 +1,643 @@
+"""
+This modulo contains the class ColumnarEngine, an alternative to the Creature objects.
+It stores every creature as a slot in columns of NumPy arrays and runs the movement,
+eating, energy and death phases of all the creatures together as array operations
+"""
+
+import math
+
+import numpy
+
+from . import genes as gns
+from .genome import Genome
+from . import utility as utl
+from . import var
+from .creature import Herbivore
+from .spatial import PredatorMap
+
+
+class ColumnarEngine(object):
+    """
+    class of the engine which stores the creatures as columns
+    """
+    BLOCK = 1024  # number of slots added every time the columns are full
+    COLUMNS = {'ID': numpy.int64, 'birth_tick': numpy.int64, 'death_tick': numpy.int64, 'death_cause': 'U1',
+               'x': numpy.float64, 'y': numpy.float64, 'energy': numpy.float64, 'death_date': numpy.int64,
+               'fertile': numpy.bool_, 'old': numpy.bool_, 'reprod_ready': numpy.bool_,
+               'sex': numpy.int8, 'diet': 'U1', 'eaten': numpy.bool_, 'dest_x': numpy.int64, 'dest_y': numpy.int64,
+               'prey': numpy.int64}
+
+    def __init__(self, world):
+        """
+        Creates the empty columns
+
+        :param world: world object where the creatures live
+        :type world: World
+        """
+        self.world = world
+        self.size = 0  # number of slots ever used
+        self.capacity = 0
+        self.free = list()  # slots of the creatures died and archived, used again by the creatures born
+        self.dtypes = dict(self.COLUMNS)
+        genes = dict(var.CREATURES_GENES, **var.CREATURES_SECONDARY_GENES)
+        for gene in genes:  # a column with the phenotype of every gene
+            if issubclass(genes[gene], gns.MendelGene):
+                self.dtypes[gene] = 'U1'
+            else:
+                self.dtypes[gene] = numpy.float64
+        self.gene_names = tuple(genes)
+        self.cols = dict()
+        for name in self.dtypes:
+            self.cols[name] = numpy.empty(0, dtype=self.dtypes[name])
+        self.parents_ID = list()  # parents of the creature of every slot
+        self.events = list()  # events of the scheduler of the world of every slot, cancelled at the death
+        self.genome = Genome()
+        self.views = list()  # view of every slot, None once the creature is dead
+        self.live = numpy.empty(0, dtype=numpy.int64)  # slots of the creatures alive
+        self.born = list()  # slots of the creatures born in the current tick
+
+    def population(self, diet, start_coords, energies, sexes, start_counts):
+        """
+        Creates the initial creatures in the first free slots, with random genes drawn together
+
+        :param diet: 'H' for herbivores, 'C' for carnivores
+        :type diet: str
+        :param start_coords: initial coordinates of every creature
+        :type start_coords: list
+        :param energies: level of initial energy of every creature
+        :type energies: list
+        :param sexes: sex of every creature
+        :type sexes: list
+        :param start_counts: age of every creature
+        :type start_counts: list
+        :return:
+        """
+        slots = self._slots_new(len(energies))
+        self.genome.randomize(slots, self.world.creatures_vars['genes_lim'], self.world.rng['setup'])
+        for gene, phenotypes in self.genome.phenotypes(slots).items():
+            self.cols[gene][slots] = phenotypes
+        for slot, start_coord, energy, sex, start_count in zip(slots.tolist(), start_coords, energies, sexes, start_counts):
+            self._slot_setup(slot, diet, start_coord, (0, 0), energy, sex, start_count)
+
+    def _births(self, slots, others):
+        """
+        Creates the children of the pairs of parents, with their genes evaluated together
+
+        :param slots: the slots of the first parents
+        :type slots: numpy.ndarray
+        :param others: the slots of the second parents
+        :type others: numpy.ndarray
+        :return:
+        """
+        cols = self.cols
+        children = self._slots_new(len(slots))
+        self.genome.reproduce(slots, others, children, self.world.creatures_vars['mutation_coeff'], self.world.rng['birth'])
+        for gene, phenotypes in self.genome.phenotypes(children).items():
+            cols[gene][children] = phenotypes
+        start_x = ((cols['x'][slots] + cols['x'][others]) / 2).tolist()
+        start_y = ((cols['y'][slots] + cols['y'][others]) / 2).tolist()
+        energy = ((cols['energy'][slots] + cols['energy'][others]) / 2).tolist()
+        sex = (self.world.rng['birth'].generator.random(len(slots)) * 2).astype(int).tolist()
+        for n, (child, slot, other) in enumerate(zip(children.tolist(), slots.tolist(), others.tolist())):
+            self._slot_setup(child, cols['diet'][slot], [start_x[n], start_y[n]], (int(cols['ID'][slot]), int(cols['ID'][other])),
+                             energy[n], sex[n], 0)
+        cols['energy'][slots] *= self.world.creatures_vars['reprod_energy_dec_coeff']
+        cols['energy'][others] *= self.world.creatures_vars['reprod_energy_dec_coeff']
+
+    def _slots_new(self, number):
+        """
+        Takes the slots released first, then the first slots never used, adding new ones if they are not enough
+
+        :param number: number of slots
+        :type number: int
+        :return: the array of the slots
+        """
+        reused = self.free[max(len(self.free) - number, 0):]
+        del self.free[len(self.free) - len(reused):]
+        number -= len(reused)
+        while self.size + number > self.capacity:
+            self._grow()
+        slots = numpy.concatenate((numpy.array(reused, dtype=numpy.int64), numpy.arange(self.size, self.size + number)))
+        self.size += number
+        return slots
+
+    def release(self, creatures):
+        """
+        Makes the slots of creatures died and archived free, so that the columns grow only with the live creatures
+
+        :param creatures: the creatures
+        :type creatures: iterable
+        :return:
+        """
+        for creature in creatures:
+            self.parents_ID[creature.slot] = None
+            self.events[creature.slot] = None
+            self.free.append(creature.slot)
+
+    def _slot_setup(self, slot, diet, start_coord, parents_ID, energy, sex, start_count):
+        """
+        Sets the columns of a new creature but the genes and schedules its events
+
+        :return:
+        """
+        cols = self.cols
+        cols['ID'][slot] = self.world.get_ID()
+        cols['birth_tick'][slot] = self.world.tick_count - start_count
+        cols['death_tick'][slot] = -1
+        cols['death_cause'][slot] = ''
+        cols['x'][slot], cols['y'][slot] = start_coord
+        cols['energy'][slot] = energy
+        cols['death_date'][slot] = int(self.world.rng['death'].gauss(self.world.creatures_vars['average_age'], self.world.creatures_vars['dev_age_prob']))
+        cols['fertile'][slot] = False
+        cols['old'][slot] = False
+        cols['reprod_ready'][slot] = False
+        cols['sex'][slot] = sex
+        cols['diet'][slot] = diet
+        cols['eaten'][slot] = False
+        cols['dest_x'][slot] = self._chunk_coord(start_coord[0], 0)
+        cols['dest_y'][slot] = self._chunk_coord(start_coord[1], 1)
+        cols['prey'][slot] = -1
+        reprod_countdown = cols['fertility'][slot] + self.world.creatures_vars['initial_reprod_countdown'] - start_count
+        # the deadlines of the creature, as Creature schedules them
+        self.events[slot] = (self.world.scheduler.schedule(self.world.tick_count + max(1, math.ceil(reprod_countdown) + 1), self._flag_set, 'fertile', slot),
+                             self.world.scheduler.schedule(self.world.tick_count + max(1, int(cols['death_date'][slot])), self._flag_set, 'old', slot))
+        self.parents_ID[slot] = parents_ID
+        view = ColumnCreature(self, slot)
+        self.views[slot] = view
+        self.born.append(slot)
+        self.world.new_born.add(view)
+
+    def _flag_set(self, flag, slot):
+        """
+        Sets the flag of the creature when the scheduler of the world calls it
+
+        :param flag: 'fertile' when the reproduction countdown expires, 'old' when the creature reaches its age of death
+        :type flag: str
+        :param slot: the slot of the creature
+        :type slot: int
+        :return:
+        """
+        self.cols[flag][slot] = True
+
+    def _grow(self):
+        """
+        Adds BLOCK free slots to every column and to the genome
+
+        :return:
+        """
+        self.capacity += self.BLOCK
+        for name in self.cols:
+            column = numpy.empty(self.capacity, dtype=self.dtypes[name])
+            column[:self.size] = self.cols[name][:self.size]
+            self.cols[name] = column
+        for slots in (self.parents_ID, self.events, self.views):
+            slots.extend([None] * self.BLOCK)
+        self.genome.grow(self.capacity)
+
+    def _chunk_coord(self, coord, i):
+        """
+        Evaluates the chunk coordinate of a creature coordinate as Creature.chunk_coord does
+
+        :param coord: the coordinate
+        :type coord: float
+        :param i: indicates which coordinate is considered (0 for the x coordinate1 for the y coordinate)
+        :type i: int
+        :return: the chunk coordinate
+        """
+        return min(int(coord / self.world.chunk_dim), self.world.coords_limits[i] - 1)
+
+    def _chunk_coords(self, slots):
+        """
+        Evaluates the chunk coordinates of many creatures together
+
+        :param slots: the slots of the creatures
+        :type slots: numpy.ndarray
+        :return: the arrays of the two chunk coordinates
+        """
+        dim = self.world.chunk_dim
+        limits = self.world.coords_limits
+        return (numpy.minimum((self.cols['x'][slots] / dim).astype(numpy.int64), limits[0] - 1),
+                numpy.minimum((self.cols['y'][slots] / dim).astype(numpy.int64), limits[1] - 1))
+
+    def update(self):
+        """
+        Updates all the live creatures, one phase at a time
+
+        :return:
+        """
+        self._born_settle()
+        live = self.live
+        cols = self.cols
+        c_vars = self.world.creatures_vars
+
+        self._reproduction_phase(live)
+
+        cx, cy = self._chunk_coords(live)
+        self._dest_phase(live, cx, cy)
+        moving = (cols['dest_x'][live] != cx) | (cols['dest_y'][live] != cy)
+        self._step_phase(live[moving])
+        self._eat_phase(live[~moving], cx[~moving], cy[~moving])
+
+        cols['energy'][live] -= c_vars['en_dec_coeff'] * cols['energy'][live]
+
+        if self.world.recorded['trajectories']:
+            self.world.trajectories.append(cols['ID'][live], cols['x'][live], cols['y'][live], cols['energy'][live],
+                                           cols['reprod_ready'][live])
+
+        dead = self._death_phase(live)
+        self.live = live[~dead]
+        self._born_settle()
+
+    def _born_settle(self):
+        """
+        Adds the creatures born since the last call to the live ones
+
+        :return:
+        """
+        if self.born:
+            self.live = numpy.concatenate((self.live, numpy.array(self.born, dtype=numpy.int64)))
+            self.born = list()
+
+    def _reproduction_phase(self, live):
+        """
+        Sets the creatures ready to reproduce and makes them mate with the first ready creature of the opposite sex
+        and the same diet in their view, as Creature._dating_agency does
+
+        :param live: the slots of the live creatures
+        :type live: numpy.ndarray
+        :return:
+        """
+        cols = self.cols
+        c_vars = self.world.creatures_vars
+        ready = cols['fertile'][live] & (cols['energy'][live] > c_vars['reprod_energy_need_coeff'] / cols['fertility'][live])
+        cols['reprod_ready'][live] = ready
+        ready_slots = live[ready]
+        if len(ready_slots) == 0:
+            return
+
+        # ready creatures of every chunk by diet and sex, in slot order, as the MateRegistry keeps them for the Creature objects,
+        # with the chunks of the creatures outside the map wrapped
+        cx, cy = self._chunk_coords(ready_slots)
+        diets = cols['diet'][ready_slots].tolist()
+        sexes = cols['sex'][ready_slots].tolist()
+        view_ray = c_vars['view_ray']
+        width = self.world.dimension['width']
+        height = self.world.dimension['height']
+        buckets = dict()
+        keys = dict()
+        for slot, i, j, diet, sex in zip(ready_slots.tolist(), cx.tolist(), cy.tolist(), diets, sexes):
+            keys[slot] = (i % width, j % height, diet, sex)
+            buckets.setdefault(keys[slot], dict())[slot] = None
+        pairs = list()
+        for slot, x, y, diet, sex in zip(ready_slots.tolist(), cx.tolist(), cy.tolist(), diets, sexes):
+            if slot not in keys:
+                continue  # already mated in this tick
+            mate = self._mate_search(x, y, diet, 1 - sex, buckets, view_ray, width, height)
+            if mate is not None:
+                pairs.append((slot, mate))
+                for other in (slot, mate):
+                    key = keys.pop(other)
+                    del buckets[key][other]
+                    if not buckets[key]:
+                        del buckets[key]
+        if pairs:
+            slots, mates = numpy.array(pairs, dtype=numpy.int64).T
+            cols['reprod_ready'][slots] = False
+            cols['reprod_ready'][mates] = False
+            self._births(slots, mates)
+
+    def _mate_search(self, x, y, diet, sex, buckets, view_ray, width, height):
+        """
+        Searches the first ready mate of the diet and the sex given in the view of the chunk (x, y)
+
+        :return: the slot of the mate or None
+        """
+        for i in range(max(x - view_ray, 0), min(x + view_ray + 1, width)):
+            for j in range(max(y - view_ray, 0), min(y + view_ray + 1, height)):
+                bucket = buckets.get((i, j, diet, sex))
+                if bucket:
+                    return next(iter(bucket))
+        return None
+
+    def _dest_phase(self, live, cx, cy):
+        """
+        Evaluates the most convenient chunk to go to for every live creature
+
+        :param live: the slots of the live creatures
+        :type live: numpy.ndarray
+        :param cx: first chunk coordinate of the live creatures
+        :type cx: numpy.ndarray
+        :param cy: second chunk coordinate of the live creatures
+        :type cy: numpy.ndarray
+        :return:
+        """
+        cols = self.cols
+        width = self.world.dimension['width']
+        height = self.world.dimension['height']
+        herbivores = cols['diet'][live] == Herbivore.DIET
+        carnivores = ~herbivores
+
+        # chunks with carnivores
+        carnivores_count = numpy.zeros((width, height), dtype=numpy.int64)
+        numpy.add.at(carnivores_count, (cx[carnivores] % width, cy[carnivores] % height), 1)
+        predators = PredatorMap(carnivores_count > 0, self.world.creatures_vars['view_ray'])
+
+        # herbivore with the most energy of every chunk, the first one in case of tie, as the PreyIndex of the World,
+        # with the chunks of the creatures outside the map wrapped
+        prey_in = dict()
+        slots = live[herbivores]
+        if len(slots):
+            hx = cx[herbivores] % width
+            hy = cy[herbivores] % height
+            chunk = (hx - hx.min()) * (hy.max() - hy.min() + 1) + (hy - hy.min())
+            order = numpy.lexsort((-cols['energy'][slots], chunk))
+            best = order[numpy.flatnonzero(numpy.diff(chunk[order], prepend=-1))]
+            for slot, i, j, coord, energy in zip(slots[best].tolist(), hx[best].tolist(), hy[best].tolist(),
+                                                 zip(cols['x'][slots[best]].tolist(), cols['y'][slots[best]].tolist()),
+                                                 cols['energy'][slots[best]].tolist()):
+                prey_in[(i, j)] = (slot, coord, energy)
+
+        self._herbivores_dest(slots, cx[herbivores], cy[herbivores], predators)
+        self._carnivores_dest(live[carnivores], cx[carnivores], cy[carnivores], prey_in)
+
+    def _energy_consume(self, x, y, coord, speed, energy):
+        """
+        Evaluates the energy a creature would use to reach the chunk (x, y), as Creature._energy_consume does
+
+        :param coord: the coordinates of the creature
+        :type coord: tuple
+        :param speed: the speed of the creature
+        :type speed: float
+        :param energy: the energy of the creature
+        :type energy: float
+        :return: energy consumption value
+        """
+        dim = self.world.chunk_dim
+        return (math.sqrt((x * dim + 5 - coord[0]) ** 2 + (y * dim + 5 - coord[1]) ** 2) /
+                speed) * self.world.creatures_vars['en_dec_coeff'] * energy
+
+    def _herbivores_dest(self, slots, cx, cy, predators):
+        """
+        Chooses the destination of the herbivores as Herbivore._dest_calc does
+
+        :param predators: the map of the carnivores in view
+        :type predators: PredatorMap
+        :return:
+        """
+        cols = self.cols
+        width = self.world.dimension['width']
+        height = self.world.dimension['height']
+
+        # the herbivores with a carnivore in view run away from it
+        inside = (cx >= 0) & (cy >= 0)
+        fleeing = numpy.zeros(len(slots), dtype=numpy.bool_)
+        fleeing[inside] = predators.near[cx[inside], cy[inside]]
+        dest_x = numpy.where(fleeing, 2 * cx - predators.source_x[cx % width, cy % height], cx)
+        dest_y = numpy.where(fleeing, 2 * cy - predators.source_y[cx % width, cy % height], cy)
+        for n in numpy.flatnonzero(~inside).tolist():
+            source = predators.flee(int(cx[n]), int(cy[n]))
+            if source is not None:
+                fleeing[n] = True
+                dest_x[n], dest_y[n] = 2 * cx[n] - source[0], 2 * cy[n] - source[1]
+
+        # the others go to the most convenient chunk
+        grazing = numpy.flatnonzero(~fleeing)
+        grazing_x, grazing_y, found = self.world.view_kernel.food_dest(
+            self.world, cx[grazing], cy[grazing], cols['x'][slots[grazing]], cols['y'][slots[grazing]],
+            cols['bigness'][slots[grazing]], cols['speed'][slots[grazing]], cols['energy'][slots[grazing]])
+        dest_x[grazing[found]] = grazing_x[found]
+        dest_y[grazing[found]] = grazing_y[found]
+        cols['dest_x'][slots] = dest_x
+        cols['dest_y'][slots] = dest_y
+
+    def _carnivores_dest(self, slots, cx, cy, prey_in):
+        """
+        Chooses the prey and the destination of the carnivores as Carnivore._dest_calc does
+
+        :param prey_in: the slot, the coordinates and the energy of the best prey in every chunk
+        :type prey_in: dict
+        :return:
+        """
+        cols = self.cols
+        view_ray = self.world.creatures_vars['view_ray']
+        width = self.world.dimension['width']
+        height = self.world.dimension['height']
+        preys = list()
+        dests = list()
+        for x, y, coord, speed, energy in zip(cx.tolist(), cy.tolist(), zip(cols['x'][slots].tolist(), cols['y'][slots].tolist()),
+                                             cols['speed'][slots].tolist(), cols['energy'][slots].tolist()):
+            prey = None
+            prey_value = float("-inf")
+            dest = None
+            for i in range(max(x - view_ray, 0), min(x + view_ray + 1, width)):
+                for j in range(max(y - view_ray, 0), min(y + view_ray + 1, height)):
+                    other = prey_in.get((i, j))
+                    if other is not None and prey_value < other[2]:
+                        prey = other
+                        prey_value = prey[2] - self._energy_consume(*prey[1], coord, speed, energy)
+                        dest = (i, j)
+            if prey is None:
+                preys.append(-1)
+                rng = self.world.rng['movement']
+                dest = (x + (-1 + int(rng.random() * 2) * 2) * 6, y + (-1 + int(rng.random() * 2) * 2) * 6)
+            else:
+                preys.append(prey[0])
+            dests.append(dest)
+        if dests:
+            cols['prey'][slots] = preys
+            cols['dest_x'][slots], cols['dest_y'][slots] = numpy.array(dests).T
+
+    def _step_phase(self, slots):
+        """
+        Makes the creatures move towards the centre of their destination chunk, as Creature._step does
+
+        :param slots: the slots of the moving creatures
+        :type slots: numpy.ndarray
+        :return:
+        """
+        cols = self.cols
+        dim = self.world.chunk_dim
+        speed = cols['speed'][slots]
+        dest_x = (cols['dest_x'][slots] + 0.5) * dim
+        dest_y = (cols['dest_y'][slots] + 0.5) * dim
+        x = cols['x'][slots]
+        y = cols['y'][slots]
+        x = x + (dest_x - x) / numpy.sqrt((dest_x - x) ** 2 + (dest_y - y) ** 2) * speed
+        y = y + (dest_y - y) / numpy.sqrt((dest_x - x) ** 2 + (dest_y - y) ** 2) * speed
+        cols['x'][slots] = x
+        cols['y'][slots] = y
+
+    def _eat_phase(self, slots, cx, cy):
+        """
+        Makes the creatures which reached their destination eat.
+        The herbivores in the same chunk eat one after the other in slot order, as they would do one at a time
+
+        :param slots: the slots of the creatures which eat
+        :type slots: numpy.ndarray
+        :return:
+        """
+        cols = self.cols
+        c_vars = self.world.creatures_vars
+        herbivores = cols['diet'][slots] == Herbivore.DIET
+
+        eaters = slots[herbivores]
+        if len(eaters):
+            width = self.world.dimension['width']
+            height = self.world.dimension['height']
+            # every axis wrapped on its own, as the indexing of the chunk grid does for off-map creatures
+            chunks = (cx[herbivores] % width) * height + cy[herbivores] % height
+            order = numpy.argsort(chunks, kind='stable')
+            eaters = eaters[order]
+            chunks = chunks[order]
+            fraction = numpy.minimum(cols['bigness'][eaters] * c_vars['eat_coeff'], 0.9)
+            left = numpy.log1p(-fraction)
+            # food share left by the herbivores which ate before in the same chunk
+            before = numpy.cumsum(left) - left
+            first = numpy.r_[True, chunks[1:] != chunks[:-1]]
+            starts = numpy.flatnonzero(first)
+            before -= before[starts][numpy.cumsum(first) - 1]
+            food = self.world.food_now(chunks)
+            eaten = food * numpy.exp(before) * fraction
+            cols['energy'][eaters] += eaten * c_vars['en_inc_coeff']
+            ends = numpy.r_[starts[1:], len(chunks)] - 1
+            self.world.food_store(chunks[ends], food[ends] * numpy.exp(before[ends] + left[ends]))
+
+        hunters = slots[~herbivores]
+        hunters = hunters[cols['prey'][hunters] >= 0]
+        if len(hunters):
+            preys = cols['prey'][hunters]
+            cols['energy'][hunters] += cols['energy'][preys] * c_vars['predator_eat_coeff']
+            cols['eaten'][preys] = True
+
+    def _death_phase(self, live):
+        """
+        Controls if the creatures have to die for starvation, temperature or age, as Creature._death_control does
+
+        :param live: the slots of the live creatures
+        :type live: numpy.ndarray
+        :return: the mask of the creatures died
+        """
+        cols = self.cols
+        cx, cy = self._chunk_coords(live)
+        prob = self.world.temp_death_table.get(cols['temp_resist'][live], cx, cy)
+
+        eaten = cols['eaten'][live]
+        starved = ~eaten & (cols['energy'][live] < 10)
+        frozen = ~eaten & ~starved & (self.world.rng['death'].generator.random(len(live)) <= prob)
+        old = ~eaten & ~starved & ~frozen & cols['old'][live]
+        for mask, cause in ((eaten, 'a'), (starved, 's'), (frozen, 't'), (old, 'a')):
+            for slot in live[mask].tolist():
+                self.death(slot, cause)
+        return eaten | starved | frozen | old
+
+    def death(self, slot, cause="e"):
+        """
+        Kills the creature in the slot
+
+        :param slot: the slot of the creature
+        :type slot: int
+        :param cause: way in which the creature die
+        :type cause: str
+        :return:
+        """
+        self.cols['death_tick'][slot] = self.world.tick_count
+        self.cols['death_cause'][slot] = cause
+        for event in self.events[slot]:
+            self.world.scheduler.cancel(event)
+        self.world.tick_dead.add(self.views[slot])
+        self.views[slot] = None  # the view is released once archived
+
+    def occupancy(self, genes):
+        """
+        Gets the chunks of the live creatures and the classes of their phenotypes, as World._tick_record records them
+
+        :param genes: the names of the genes recorded by spreading
+        :type genes: iterable
+        :return: the arrays of the coordinates of the chunks and the dictionary with the arrays of the classes
+        """
+        self._born_settle()
+        cx, cy = self._chunk_coords(self.live)
+        return cx, cy, {name: self.genome.rec_classes(self.live, name) for name in genes}
+
+
+class ColumnCreature(object):
+    """
+    class of the views on a slot of the ColumnarEngine, with the interface of Creature used by World
+    """
+    TO_RECORD_ = var.TO_RECORD['creature']
+    __slots__ = ('engine', 'slot')
+
+    def __init__(self, engine, slot):
+        """
+        Creates a view on a slot
+
+        :param engine: the engine where the creature is stored
+        :type engine: ColumnarEngine
+        :param slot: the slot of the creature
+        :type slot: int
+        """
+        self.engine = engine
+        self.slot = slot
+
+    def __hash__(self):
+        # the order of the sets of creatures depends only on the simulation
+        return int(self.slot)
+
+    @property
+    def ID(self):
+        return int(self.engine.cols['ID'][self.slot])
+
+    @property
+    def birth_tick(self):
+        return int(self.engine.cols['birth_tick'][self.slot])
+
+    @property
+    def death_tick(self):
+        death_tick = int(self.engine.cols['death_tick'][self.slot])
+        if death_tick < 0:
+            return None
+        return death_tick
+
+    @property
+    def death_cause(self):
+        return str(self.engine.cols['death_cause'][self.slot]) or None
+
+    @property
+    def parents_ID(self):
+        return self.engine.parents_ID[self.slot]
+
+    @property
+    def sex(self):
+        return int(self.engine.cols['sex'][self.slot])
+
+    @property
+    def diet(self):
+        return str(self.engine.cols['diet'][self.slot])
+
+    @property
+    def genes(self):
+        return self.engine.genome.genes(self.slot)
+
+    @property
+    def tick_history(self):
+        return self.engine.world.trajectories.history(self.ID)
+
+    def death(self, cause="e"):
+        """
+        Kills the creature
+
+        :param cause: way in which the creature die
+        :type cause: str
+        :return:
+        """
+        self.engine.death(self.slot, cause)
+
+    def end(self):
+        """
+        Gets the data of the creature to save after its death, as strings in the order of the file.
+        The states of the ticks recorded are left as None, they are taken from the TrajectoryStore when written
+
+        :return: the list of the strings
+        """
+        return [None if i == 'tick_history' else utl.add_to_write(getattr(self, i), self.engine.world.analysis['rounding'])
+                for i in self.TO_RECORD_]
@@ -3,7 +3,8 @@ This modulo contains all the classes to control the different types of genes in
 a creature (numeric, mendelian etc.), how they are transmitted and their mutations
 """
 
-from random import random as rnd, gauss
+import numpy
+
 from .alleles import *
 
 
@@ -12,6 +13,7 @@ class BaseGene(object):
     generic gene object
     """
     REC_TYPE = None
+    __slots__ = ('genotype', 'phenotype')
 
     def __init__(self, gen=None):
         """
@@ -40,13 +42,15 @@ class BaseGene(object):
         """
         pass
 
-    def reproduce(self, other, sigma):
+    def reproduce(self, other, sigma, rng):
         """
         method to reproduce a gene with another
 
         :param other: the other gene
         :type other: BaseGene object
         :param sigma:
+        :param rng: the stream of random numbers
+        :type rng: RandomStream
 
         :return: None
         """
@@ -74,11 +78,46 @@ class MendelGene(BaseGene):
     class of mendelian genes
     """
     ALLELES = []  # list of all possible alleles
+    ALLELE_OBJECTS = ()  # the shared Allele objects of ALLELES
+    REC_CLASSES = ()
+    PHENOTYPES = None  # phenotype of every pair of indexes of alleles
+    REC_INDEX = dict()  # index in REC_CLASSES of every phenotype
+    REC_TABLE = None  # index in REC_CLASSES of every pair of indexes of alleles
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Creates the shared Allele objects of the subclass and compiles its tables of the phenotypes
+
+        :return:
+        """
+        super(MendelGene, cls).__init_subclass__(**kwargs)
+        cls.ALLELE_OBJECTS = tuple(Allele(*allele, index=i) for i, allele in enumerate(cls.ALLELES))
+        cls.PHENOTYPES = numpy.array([[cls._phenotype_rule(first, second) for second in cls.ALLELE_OBJECTS]
+                                      for first in cls.ALLELE_OBJECTS])
+        cls.REC_INDEX = {phen: i for i, phens in enumerate(cls.REC_CLASSES) for phen in phens}
+        cls.REC_TABLE = numpy.array([[cls.REC_INDEX.get(phen, -1) for phen in row] for row in cls.PHENOTYPES.tolist()])
+
+    @staticmethod
+    def _phenotype_rule(first, second):
+        """
+        it evaluates the phenotype of a pair of alleles
 
-    def randomize(self, lims=None):
+        :param first: the first allele
+        :type first: Allele object
+        :param second: the second allele
+        :type second: Allele object
+
+        :return: the phenotype
+        """
+        return first + second
+
+    def randomize(self, rng, lims=None):
         """
         it creates a generic random gene with 2 alleles taken from the list ALLELES
 
+        :param rng: the stream of random numbers
+        :type rng: RandomStream
         :param lims: None
         :type lims: boolean
 
@@ -86,29 +125,31 @@ class MendelGene(BaseGene):
         """
         genotype = list()
         for i in range(2):
-            genotype.append(Allele(*self.ALLELES[int(rnd() * len(self.ALLELES))]))
+            genotype.append(self.ALLELE_OBJECTS[int(rng.random() * len(self.ALLELE_OBJECTS))])
         self.genotype = genotype
         super(MendelGene, self).randomize()
 
     def _phenotype_calc(self):
         """
-        evaluates the phenotype of the gene
+        evaluates the phenotype of the gene from the table of the class
 
         :return:
         """
-        self.phenotype = self.genotype[0] + self.genotype[1]
+        self.phenotype = self.PHENOTYPES.item(self.genotype[0].index, self.genotype[1].index)
 
-    def reproduce(self, other, sigma):
+    def reproduce(self, other, sigma, rng):
         """
         it reproduces itself with another gene created a random gene
 
         :param other: the other gene
         :param other: MendelGene object
         :param sigma:
+        :param rng: the stream of random numbers
+        :type rng: RandomStream
 
         :return: the new gene
         """
-        return type(self)(gen=[self.genotype[int(rnd() * 2)], other.genotype[int(rnd() * 2)]])
+        return type(self)(gen=[self.genotype[int(rng.random() * 2)], other.genotype[int(rng.random() * 2)]])
 
 
 class NumberGene(BaseGene):
@@ -116,17 +157,20 @@ class NumberGene(BaseGene):
     class of numeric characteristics
     """
     REC_TYPE = 'num'
+    __slots__ = ()
 
-    def randomize(self, lims):
+    def randomize(self, rng, lims):
         """
         it creates a random number respecting the limits
 
+        :param rng: the stream of random numbers
+        :type rng: RandomStream
         :param lims: tuple of the 2 extreme limits
         :type lims: tuple
 
         :return:
         """
-        self.genotype = lims[0] + rnd() * (lims[1] - lims[0])
+        self.genotype = lims[0] + rng.random() * (lims[1] - lims[0])
         super(NumberGene, self).randomize()
 
     def _phenotype_calc(self):
@@ -137,7 +181,7 @@ class NumberGene(BaseGene):
         """
         self.phenotype = self.genotype
 
-    def reproduce(self, other, sigma):
+    def reproduce(self, other, sigma, rng):
         """
         it reproduces itself with another gene. It is chosen one of the
         two genes and than it is applied a mutation on it. The mutation is chosen
@@ -147,18 +191,137 @@ class NumberGene(BaseGene):
         :param other: NumberGene object
         :param sigma: standard deviation of the mutation
         :param sigma: int
+        :param rng: the stream of random numbers
+        :type rng: RandomStream
 
         :return: the new gene
         """
         parents = (self, other)
-        random = int(rnd() * 2)
-        return type(self)(gen=(parents[random].phenotype * gauss(1, sigma)))
+        random = int(rng.random() * 2)
+        return type(self)(gen=(parents[random].phenotype * rng.gauss(1, sigma)))
+
+
+class PolyGene(BaseGene):
+    """
+    class of numeric characteristics given by many mendelian loci.
+    The genotype is a pair of haplotypes, every one with a bit for every locus packed in uint64 words
+    (1 is the dominant allele which increases the phenotype), and the limits of the phenotype.
+    The methods of the class work on arrays of many genotypes too
+    """
+    REC_TYPE = 'num'
+    LOCI = 64  # number of loci
+    WORDS = 1  # number of uint64 words of a haplotype
+    PLUS_FREQ = 1 - 0.5 ** 0.5  # initial frequency of the dominant allele: half of the loci are expressed
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Evaluates the number of words of the haplotypes of the subclass
+
+        :return:
+        """
+        super(PolyGene, cls).__init_subclass__(**kwargs)
+        cls.WORDS = -(-cls.LOCI // 64)
+
+    @classmethod
+    def random_bits(cls, shape, prob, rng):
+        """
+        it creates random haplotypes
+
+        :param shape: the shape of the array of haplotypes
+        :type shape: tuple
+        :param prob: the probability of every bit to be 1
+        :type prob: float
+        :param rng: the stream of random numbers
+        :type rng: RandomStream
+
+        :return: the array of haplotypes, with a last axis of WORDS words
+        """
+        bits = rng.generator.random(shape + (cls.WORDS * 64,)) < prob
+        bits[..., cls.LOCI:] = False
+        return numpy.packbits(bits, axis=-1, bitorder='little').view(numpy.uint64)
+
+    @classmethod
+    def gametes(cls, haplotypes, sigma, rng):
+        """
+        it creates a gamete from every pair of haplotypes, with recombination and mutation:
+        every locus comes from a random haplotype and mutates with probability sigma
+
+        :param haplotypes: the array of the pairs of haplotypes, with shape (..., 2, WORDS)
+        :type haplotypes: numpy.ndarray
+        :param sigma: probability of mutation of every locus
+        :type sigma: float
+        :param rng: the stream of random numbers
+        :type rng: RandomStream
+
+        :return: the array of gametes, with shape (..., WORDS)
+        """
+        shape = haplotypes.shape[:-2]
+        mask = cls.random_bits(shape, 0.5, rng)
+        gametes = (haplotypes[..., 0, :] & mask) | (haplotypes[..., 1, :] & ~mask)
+        return gametes ^ cls.random_bits(shape, sigma, rng)
+
+    @classmethod
+    def express(cls, haplotypes, lims):
+        """
+        it evaluates the phenotype from the number of loci where the dominant allele is present
+
+        :param haplotypes: the array of the pairs of haplotypes, with shape (..., 2, WORDS)
+        :type haplotypes: numpy.ndarray
+        :param lims: the limits of the phenotype
+        :type lims: tuple
+
+        :return: the phenotype, or the array of the phenotypes
+        """
+        expressed = haplotypes[..., 0, :] | haplotypes[..., 1, :]
+        count = numpy.unpackbits(expressed.view(numpy.uint8), axis=-1).sum(axis=-1)
+        return lims[0] + (lims[1] - lims[0]) * count / cls.LOCI
+
+    def randomize(self, rng, lims):
+        """
+        it creates random haplotypes
+
+        :param rng: the stream of random numbers
+        :type rng: RandomStream
+        :param lims: tuple of the 2 extreme limits of the phenotype
+        :type lims: tuple
+
+        :return:
+        """
+        self.genotype = (self.random_bits((2,), self.PLUS_FREQ, rng), tuple(lims))
+        super(PolyGene, self).randomize()
+
+    def _phenotype_calc(self):
+        """
+        it evaluates the phenotype
+
+        :return:
+        """
+        self.phenotype = float(self.express(*self.genotype))
+
+    def reproduce(self, other, sigma, rng):
+        """
+        it reproduces itself with another gene joining a gamete of each
+
+        :param other: the other gene
+        :param other: PolyGene object
+        :param sigma: probability of mutation of every locus
+        :param sigma: float
+        :param rng: the stream of random numbers
+        :type rng: RandomStream
+
+        :return: the new gene
+        """
+        haplotypes = numpy.stack((self.gametes(self.genotype[0], sigma, rng), self.gametes(other.genotype[0], sigma, rng)))
+        return type(self)(gen=(haplotypes, self.genotype[1]))
 
 
 class SecondaryGene(BaseGene):
     """
     Genes which have other genes as genotype
     """
+    GENOTYPE = ()  # names of the genes of the genotype
+    __slots__ = ()
 
     def _phenotype_calc(self):
         """
@@ -168,7 +331,7 @@ class SecondaryGene(BaseGene):
         """
         pass
 
-    def reproduce(self, other, sigma):
+    def reproduce(self, other, sigma, rng):
         """
         it reproduces itself
 
@@ -176,12 +339,14 @@ class SecondaryGene(BaseGene):
         :type other: BaseGene object or an object derived
         :param sigma: standard deviation (if numeric gene considered) or None
         :type sigma: int or boolean
+        :param rng: the stream of random numbers
+        :type rng: RandomStream
 
         :return: the new gene
         """
         new_gen = dict()
         for i in self.genotype:
-            new_gen[i] = self.genotype[i].reproduce(other.genotype[i], sigma)
+            new_gen[i] = self.genotype[i].reproduce(other.genotype[i], sigma, rng)
         return type(self)(gen=new_gen)
 
 
@@ -193,20 +358,25 @@ class TempResist(MendelGene):
     REC_CLASSES = (('N', 'n'), ('c',), ('l',))
     REC_CHUNK_ATTR = 'temperature'
     ALLELES = (('N', DOMINANT), ('c', RECESSIVE), ('l', RECESSIVE))
+    __slots__ = ()
 
-    def _phenotype_calc(self):
+    @staticmethod
+    def _phenotype_rule(first, second):
         """
         it evaluates the phenotype following mendelian rules
 
-        :return:
+        :param first: the first allele
+        :type first: Allele object
+        :param second: the second allele
+        :type second: Allele object
+
+        :return: the phenotype
         """
-        if self.genotype[0].is_dominant() or self.genotype[1].is_dominant():
-            phen = 'N'
-        elif not self.genotype[0] == self.genotype[1]:
-            phen = 'n'
-        else:
-            phen = self.genotype[0].value
-        self.phenotype = phen
+        if first.is_dominant() or second.is_dominant():
+            return 'N'
+        elif not first == second:
+            return 'n'
+        return first.value
 
 
 class MendelControl(MendelGene):
@@ -218,40 +388,64 @@ class MendelControl(MendelGene):
     REC_CLASSES = (('A',), ('a',))
     REC_CHUNK_ATTR = 'temperature'
     ALLELES = (('A', DOMINANT), ('a', RECESSIVE))
+    __slots__ = ()
 
 
 class Agility(NumberGene):
     """
     class of the agility gene
     """
-    pass
+    __slots__ = ()
 
 
 class Bigness(NumberGene):
     """
     class of the bigness gene
     """
-    pass
+    __slots__ = ()
 
 
 class Fertility(NumberGene):
     """
     class of the fertility gene
     """
-    pass
+    __slots__ = ()
 
 
 class NumControl(NumberGene):
     """
     class of the NumControl gene
     """
-    pass
+    __slots__ = ()
+
+
+class PolyAgility(PolyGene):
+    """
+    class of the agility gene given by many loci
+    """
+    __slots__ = ()
+
+
+class PolyBigness(PolyGene):
+    """
+    class of the bigness gene given by many loci
+    """
+    __slots__ = ()
+
+
+class PolyFertility(PolyGene):
+    """
+    class of the fertility gene given by many loci
+    """
+    __slots__ = ()
 
 
 class Speed(SecondaryGene, NumberGene):
     """
     class of the speed gene
     """
+    GENOTYPE = ('agility', 'bigness')
+    __slots__ = ()
 
     def _phenotype_calc(self):
         """
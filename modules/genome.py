@@ -0,0 +1,169 @@
+"""
+this module contains the class Genome which stores the genes of many creatures as matrices,
+as the creatures of the ColumnarEngine and the initial creatures of the World:
+a float matrix with the numeric genes, a small integer matrix with the alleles of the mendelian genes
+and a matrix of bit-packed haplotypes for every gene given by many loci.
+The genes to store and their rules are the ones of the classes in var.CREATURES_GENES
+"""
+
+import numpy
+
+from . import genes as gns
+from . import var
+
+
+class Genome(object):
+    """
+    class of the matrices of the genes, with a row for every slot of the engine
+    """
+
+    def __init__(self):
+        """
+        Creates the empty matrices
+        """
+        self.numeric = tuple(name for name, cls in var.CREATURES_GENES.items() if issubclass(cls, gns.NumberGene))
+        self.mendel = tuple(name for name, cls in var.CREATURES_GENES.items() if issubclass(cls, gns.MendelGene))
+        self.numbers = numpy.empty((0, len(self.numeric)))
+        self.alleles = numpy.empty((0, len(self.mendel), 2), dtype=numpy.int8)  # indexes in ALLELE_OBJECTS
+        self.poly = tuple(name for name, cls in var.CREATURES_GENES.items() if issubclass(cls, gns.PolyGene))
+        self.loci = {name: numpy.zeros((0, 2, var.CREATURES_GENES[name].WORDS), dtype=numpy.uint64) for name in self.poly}
+        self.lims = dict()  # limits of the phenotype of every gene given by many loci
+
+    def grow(self, capacity):
+        """
+        Adds rows up to the capacity given
+
+        :param capacity: the new number of rows
+        :type capacity: int
+        :return:
+        """
+        numbers = numpy.empty((capacity, len(self.numeric)))
+        numbers[:len(self.numbers)] = self.numbers
+        self.numbers = numbers
+        alleles = numpy.empty((capacity, len(self.mendel), 2), dtype=numpy.int8)
+        alleles[:len(self.alleles)] = self.alleles
+        self.alleles = alleles
+        for name in self.poly:
+            loci = numpy.zeros((capacity,) + self.loci[name].shape[1:], dtype=numpy.uint64)
+            loci[:len(self.loci[name])] = self.loci[name]
+            self.loci[name] = loci
+
+    def randomize(self, slots, lims, rng):
+        """
+        Creates random genes for the creatures together, as the randomize methods of the genes do
+
+        :param slots: the slots of the creatures
+        :type slots: numpy.ndarray
+        :param lims: the limits of the numeric genes
+        :type lims: dict
+        :param rng: the stream of random numbers
+        :type rng: RandomStream
+        :return:
+        """
+        for i, name in enumerate(self.numeric):
+            self.numbers[slots, i] = lims[name][0] + rng.generator.random(len(slots)) * (lims[name][1] - lims[name][0])
+        for i, name in enumerate(self.mendel):
+            alleles = len(var.CREATURES_GENES[name].ALLELE_OBJECTS)
+            self.alleles[slots, i] = (rng.generator.random((len(slots), 2)) * alleles).astype(int)
+        for name in self.poly:
+            cls = var.CREATURES_GENES[name]
+            self.loci[name][slots] = cls.random_bits((len(slots), 2), cls.PLUS_FREQ, rng)
+            self.lims[name] = tuple(lims[name])
+
+    def reproduce(self, slots, others, children, sigma, rng):
+        """
+        Creates the genes of the children of the pairs of parents together, as the reproduce methods of the genes do:
+        every numeric gene comes from a random parent with a gaussian mutation,
+        every mendelian gene takes a random allele from each parent,
+        every gene given by many loci takes a gamete from each parent
+
+        :param slots: the slots of the first parents
+        :type slots: numpy.ndarray
+        :param others: the slots of the second parents
+        :type others: numpy.ndarray
+        :param children: the slots of the children
+        :type children: numpy.ndarray
+        :param sigma: standard deviation of the mutation
+        :type sigma: float
+        :param rng: the stream of random numbers
+        :type rng: RandomStream
+        :return:
+        """
+        shape = (len(children), len(self.numeric))
+        parents = numpy.where(rng.generator.random(shape) < 0.5, slots[:, None], others[:, None])
+        self.numbers[children] = self.numbers[parents, numpy.arange(shape[1])] * rng.generator.normal(1, sigma, shape)
+        shape = (len(children), len(self.mendel))
+        genes = numpy.arange(shape[1])
+        self.alleles[children, :, 0] = self.alleles[slots[:, None], genes, (rng.generator.random(shape) * 2).astype(int)]
+        self.alleles[children, :, 1] = self.alleles[others[:, None], genes, (rng.generator.random(shape) * 2).astype(int)]
+        for name in self.poly:
+            cls = var.CREATURES_GENES[name]
+            self.loci[name][children, 0] = cls.gametes(self.loci[name][slots], sigma, rng)
+            self.loci[name][children, 1] = cls.gametes(self.loci[name][others], sigma, rng)
+
+    def phenotypes(self, slots):
+        """
+        Evaluates the phenotypes of all the genes, the secondary ones too, of the creatures
+
+        :param slots: the slots of the creatures
+        :type slots: numpy.ndarray
+        :return: dictionary with the array of the phenotypes of every gene
+        """
+        phenotypes = dict()
+        for i, name in enumerate(self.numeric):
+            phenotypes[name] = self.numbers[slots, i]
+        for i, name in enumerate(self.mendel):
+            phenotypes[name] = var.CREATURES_GENES[name].PHENOTYPES[self.alleles[slots, i, 0], self.alleles[slots, i, 1]]
+        for name in self.poly:
+            phenotypes[name] = var.CREATURES_GENES[name].express(self.loci[name][slots], self.lims[name])
+        for name, cls in var.CREATURES_SECONDARY_GENES.items():
+            # the rules of the gene applied to whole arrays
+            phenotypes[name] = cls({i: Phenotypes(phenotypes[i]) for i in cls.GENOTYPE}).get()
+        return phenotypes
+
+    def rec_classes(self, slots, name):
+        """
+        Evaluates the classes of the phenotypes of a mendelian gene of the creatures
+
+        :param slots: the slots of the creatures
+        :type slots: numpy.ndarray
+        :param name: the name of the gene
+        :type name: str
+        :return: the array of the indexes in REC_CLASSES
+        """
+        i = self.mendel.index(name)
+        return var.CREATURES_GENES[name].REC_TABLE[self.alleles[slots, i, 0], self.alleles[slots, i, 1]]
+
+    def genes(self, slot):
+        """
+        Creates the gene objects of a creature
+
+        :param slot: the slot of the creature
+        :type slot: int
+        :return: dictionary with the gene objects
+        """
+        genes = dict()
+        for name, number in zip(self.numeric, self.numbers[slot].tolist()):
+            genes[name] = var.CREATURES_GENES[name](gen=number)
+        for name, (first, second) in zip(self.mendel, self.alleles[slot].tolist()):
+            alleles = var.CREATURES_GENES[name].ALLELE_OBJECTS
+            genes[name] = var.CREATURES_GENES[name](gen=[alleles[first], alleles[second]])
+        for name in self.poly:
+            genes[name] = var.CREATURES_GENES[name](gen=(self.loci[name][slot].copy(), self.lims[name]))
+        genes = {name: genes[name] for name in var.CREATURES_GENES}  # the order of the records
+        for name, cls in var.CREATURES_SECONDARY_GENES.items():
+            genes[name] = cls({i: genes[i] for i in cls.GENOTYPE})
+        return genes
+
+
+class Phenotypes(object):
+    """
+    class of an array of phenotypes with the interface of a gene
+    """
+    __slots__ = ('phenotype',)
+
+    def __init__(self, phenotype):
+        self.phenotype = phenotype
+
+    def get(self):
+        return self.phenotype
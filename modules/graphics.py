@@ -10,20 +10,58 @@ from . import utility as utl
 from . import var
 
 
+def interpolate(records, position):
+    """
+    it evaluates a record between two of the records given, linearly.
+    The positions before the first record and after the last one get these
+
+    :param records: the records, numbers or sequences of numbers
+    :type records: list or numpy.ndarray
+    :param position: the position of the record, which can be fractional
+    :type position: float
+
+    :return: the record, None if there are no records
+    """
+    if len(records) == 0:  # the records can be an array
+        return None
+    last = len(records) - 1
+    i = min(max(math.floor(position), 0), last)
+    j = min(i + 1, last)
+    fract = min(max(position - i, 0), 1)
+    if isinstance(records[i], (list, tuple)):
+        return [first + (second - first) * fract for first, second in zip(records[i], records[j])]
+    first, second = float(records[i]), float(records[j])  # the records can be small unsigned integers
+    return first + (second - first) * fract
+
+
 class ChunkD:
     """
     class to represent a Chunk object on the screen
     """
 
-    def __init__(self, chunk_data):
+    def __init__(self, chunk_data, food_history, interval):
         """
         creates a new object
 
         :param chunk_data: string with all the data of the chunk to be represented
         :type chunk_data: str
+        :param food_history: the food of all the chunks in the ticks recorded, None if it has not been recorded
+                             or if it is in the chunk data, as the old simulations have it
+        :type food_history: numpy.ndarray
+        :param interval: ticks between two records of the food
+        :type interval: int
         """
-        restored = utl.get_from_string(chunk_data, var.TO_RECORD['chunk'])
+        self.food_history = None
+        if len(chunk_data.split(var.FILE_SEPARATORS[0])) == len(var.LEGACY_TO_RECORD['chunk']):
+            restored = utl.get_from_string(chunk_data, var.LEGACY_TO_RECORD['chunk'])
+            # a record of the food every tick, as (food,)
+            restored['food_history'] = [record[0] if type(record) == list else record for record in restored['food_history']]
+        else:
+            restored = utl.get_from_string(chunk_data, var.TO_RECORD['chunk'])
         self.__dict__.update(restored)
+        if food_history is not None:
+            self.food_history = food_history[:, self.coord[0], self.coord[1]]
+        self.interval = interval
 
     def draw(self, surface, tick, chunk_dim, zoom):
         """
@@ -42,7 +80,11 @@ class ChunkD:
         pyg.draw.rect(surface, self._get_color(tick), self._get_rect(chunk_dim, zoom))
 
     def _get_color(self, tick):
-        return pyg.Color(0, int(self.food_history[int(tick) - 1] * 255 / 100), 0, 255)
+        if self.food_history is None:
+            return pyg.Color(0, 0, 0, 255)
+        # the records are in the ticks multiple of the interval, starting from the first
+        food = interpolate(self.food_history, int(tick) / self.interval - 1)
+        return pyg.Color(0, int(food * 255 / 100), 0, 255)
 
     def _get_rect(self, chunk_dim, zoom):
         fact = chunk_dim * zoom / 10
@@ -57,15 +99,18 @@ class CreaturesD:
     DIMS = var.DEFAULT_CREATURES_DIMS
     BORDER = var.DEFAULT_CREATURES_BORDER
 
-    def __init__(self, creature_data):
+    def __init__(self, creature_data, interval):
         """
         creates a new object
 
         :param creature_data: string with all the data of the chunk to be represented
         :type creature_data: str
+        :param interval: ticks between two records of the state of the creature, 0 if it has not been recorded
+        :type interval: int
         """
         restored = utl.get_from_string(creature_data, var.TO_RECORD['creature'])
         self.__dict__.update(restored)
+        self.interval = interval
         self.colors = dict()
         self.dims = dict()
         self.color_dims_creation()
@@ -107,17 +152,15 @@ class CreaturesD:
         :return:
         """
         fact = zoom / 10
-        birth = max(self.birth_tick + 1, 1)
-        coord = [0, 0]
-        for i in range(2):
-            try:
-                coord[i] = int(self.tick_history[tick - birth][i] * fact)
-            except TypeError:
-                if tick - birth == -1:
-                    return
+        birth = max(self.birth_tick + 1, 1)  # the first tick the creature is updated in
+        if not self.interval or not self.tick_history or tick < birth:  # creatures lived between two records have none
+            return
+        first = -(-birth // self.interval) * self.interval  # the first tick recorded
+        state = interpolate(self.tick_history, (tick - first) / self.interval)
+        coord = [int(state[0] * fact), int(state[1] * fact)]
 
         if dim_flag == 'energy':
-            dim = int(self.tick_history[tick - birth][2] / 10 * fact) * self.DIMS['energy']
+            dim = int(state[2] / 10 * fact) * self.DIMS['energy']
         else:
             dim = int(self.dims[dim_flag] * fact)
 
@@ -0,0 +1,427 @@
+"""
+this module contains the class TrajectoryStore which records the state of every creature in every tick
+(coordinates, energy and reproduction readiness) in shared columns of NumPy arrays, instead of a list of tuples
+for every creature, the class OccupancyStore which records the number of creatures in every chunk,
+the class IntervalIndex of the lives of the creatures ever lived and the class CreatureArchive which writes
+the data of the creatures to file as they die
+"""
+
+import numpy
+
+from . import utility as utl
+
+
+class TrajectoryStore(object):
+    """
+    class of the append-only columns of the states of the creatures, a row for every creature in every tick.
+    The coordinates are stored as fixed-point numbers with two decimal places
+    """
+    BLOCK = 65536  # minimum number of rows added every time the columns are full
+    COLUMNS = {'key': numpy.int32, 'x': numpy.int32, 'y': numpy.int32, 'energy': numpy.int32, 'ready': numpy.int8}
+    SCALE = 100  # fixed-point scale of the coordinates
+
+    def __init__(self):
+        """
+        Creates the empty columns
+        """
+        self.size = 0  # number of rows used
+        self.cols = {name: numpy.empty(0, dtype=dtype) for name, dtype in self.COLUMNS.items()}
+        self.pending = {name: list() for name in self.COLUMNS}  # rows recorded one at a time, not yet in the columns
+        self.sorted = None  # (keys, rows) of the rows sorted by creature, as long as no row is added
+
+    def record(self, key, x, y, energy, ready):
+        """
+        Records the state of a creature, which is added to the columns by the next flush
+
+        :param key: the ID of the creature
+        :type key: int
+        :param x: the first coordinate
+        :type x: float
+        :param y: the second coordinate
+        :type y: float
+        :param energy: the energy
+        :type energy: float
+        :param ready: the reproduction readiness
+        :type ready: bool
+        :return:
+        """
+        pending = self.pending
+        pending['key'].append(key)
+        pending['x'].append(x)
+        pending['y'].append(y)
+        pending['energy'].append(energy)
+        pending['ready'].append(ready)
+
+    def flush(self):
+        """
+        Adds the states recorded one at a time to the columns
+
+        :return:
+        """
+        if self.pending['key']:
+            self.append(**{name: numpy.array(values) for name, values in self.pending.items()})
+            self.pending = {name: list() for name in self.COLUMNS}
+
+    def append(self, key, x, y, energy, ready):
+        """
+        Adds the states of many creatures to the columns
+
+        :param key: the IDs of the creatures
+        :type key: numpy.ndarray
+        :param x: the first coordinates
+        :type x: numpy.ndarray
+        :param y: the second coordinates
+        :type y: numpy.ndarray
+        :param energy: the energies
+        :type energy: numpy.ndarray
+        :param ready: the reproduction readinesses
+        :type ready: numpy.ndarray
+        :return:
+        """
+        start, end = self.size, self.size + len(key)
+        if end > len(self.cols['key']):
+            self._grow(max(self.BLOCK, 2 * end))
+        cols = self.cols
+        cols['key'][start:end] = key
+        cols['x'][start:end] = numpy.round(x * self.SCALE)
+        cols['y'][start:end] = numpy.round(y * self.SCALE)
+        cols['energy'][start:end] = energy
+        cols['ready'][start:end] = ready
+        self.size = end
+        self.sorted = None
+
+    def _grow(self, capacity):
+        """
+        Enlarges the columns
+
+        :param capacity: the new number of rows
+        :type capacity: int
+        :return:
+        """
+        for name in self.cols:
+            col = numpy.empty(capacity, dtype=self.cols[name].dtype)
+            col[:self.size] = self.cols[name][:self.size]
+            self.cols[name] = col
+
+    def history(self, key):
+        """
+        Gets the states of a creature in the order of the ticks
+
+        :param key: the ID of the creature
+        :type key: int
+        :return: the list of the tuples (x, y, energy, ready)
+        """
+        if self.sorted is None:
+            keys = self.cols['key'][:self.size]
+            rows = numpy.argsort(keys, kind='stable')
+            self.sorted = (keys[rows], rows)
+        keys, rows = self.sorted
+        rows = rows[numpy.searchsorted(keys, key):numpy.searchsorted(keys, key, 'right')]
+        cols = self.cols
+        return list(zip((cols['x'][rows] / self.SCALE).tolist(), (cols['y'][rows] / self.SCALE).tolist(),
+                        cols['energy'][rows].tolist(), cols['ready'][rows].tolist()))
+
+    def release(self, keys):
+        """
+        Removes the states of the creatures given from the columns
+
+        :param keys: the IDs of the creatures
+        :type keys: list
+        :return: dictionary with the list of the tuples (x, y, energy, ready) of every creature, in the order of the ticks
+        """
+        cols = self.cols
+        released = numpy.isin(cols['key'][:self.size], keys)
+        rows = numpy.flatnonzero(released)
+        rows = rows[numpy.argsort(cols['key'][rows], kind='stable')]
+        states = list(zip((cols['x'][rows] / self.SCALE).tolist(), (cols['y'][rows] / self.SCALE).tolist(),
+                          cols['energy'][rows].tolist(), cols['ready'][rows].tolist()))
+        histories = {key: list() for key in keys}
+        for key, state in zip(cols['key'][rows].tolist(), states):
+            histories[key].append(state)
+        kept = numpy.flatnonzero(~released)
+        for name in cols:
+            cols[name][:len(kept)] = cols[name][kept]
+        self.size = len(kept)
+        self.sorted = None
+        return histories
+
+
+class OccupancyStore(object):
+    """
+    class of the grids of the number of creatures in every chunk in the ticks recorded,
+    in total and by class of phenotype of every gene recorded by spreading (REC_TYPE 'spr')
+    """
+
+    def __init__(self, width, height, genes):
+        """
+        Creates an empty store
+
+        :param width: number of chunks in the first coordinate
+        :type width: int
+        :param height: number of chunks in the second coordinate
+        :type height: int
+        :param genes: the classes of the genes recorded by spreading, by name
+        :type genes: dict
+        """
+        self.shape = (width, height)
+        self.genes = genes
+        self.records = dict()  # tick: (grid, grid with the classes as first axis of every gene) of every record kept
+
+    def count(self, x, y, classes):
+        """
+        Counts the creatures given by their chunks and their classes, without recording them
+
+        :param x: the first coordinates of the chunks of the creatures
+        :type x: list
+        :param y: the second coordinates of the chunks of the creatures
+        :type y: list
+        :param classes: the indexes in REC_CLASSES of the phenotypes of the creatures, by gene
+        :type classes: dict
+        :return: the grid of the total and the dictionary of the grids by class of every gene
+        """
+        x = numpy.asarray(x, dtype=numpy.int64)
+        y = numpy.asarray(y, dtype=numpy.int64)
+        total = numpy.zeros(self.shape, dtype=numpy.int32)
+        numpy.add.at(total, (x, y), 1)
+        grids = dict()
+        for name, cls in self.genes.items():
+            grid = numpy.zeros((len(cls.REC_CLASSES),) + self.shape, dtype=numpy.int32)
+            numpy.add.at(grid, (numpy.asarray(classes[name], dtype=numpy.int64), x, y), 1)
+            grids[name] = grid
+        return total, grids
+
+    def record(self, tick, x, y, classes):
+        """
+        Records the creatures given by their chunks and their classes in a tick
+
+        :param tick: the tick of the record
+        :type tick: int
+        :param x: the first coordinates of the chunks of the creatures
+        :type x: list
+        :param y: the second coordinates of the chunks of the creatures
+        :type y: list
+        :param classes: the indexes in REC_CLASSES of the phenotypes of the creatures, by gene
+        :type classes: dict
+        :return:
+        """
+        self.records[tick] = self.count(x, y, classes)
+
+    def grids(self, tick):
+        """
+        Gets the grids of a record
+
+        :param tick: the tick of the record
+        :type tick: int
+        :return: the grid of the total and the dictionary of the grids by class of every gene
+        """
+        return self.records[tick]
+
+    def drop(self, tick):
+        """
+        Forgets the records before the tick given
+
+        :param tick: the tick of the first record to keep
+        :type tick: int
+        :return:
+        """
+        for old in [old for old in self.records if old < tick]:
+            del self.records[old]
+
+
+class IntervalIndex(object):
+    """
+    class of the columns of the lives of the creatures ever lived (birth tick, death tick, death cause
+    and the phenotypes of the numeric genes), a row for every creature in the order they are added.
+    The rows sorted by birth tick give the creatures alive in a tick without scanning all of them
+    """
+    BLOCK = 65536  # minimum number of rows added every time the columns are full
+    CAUSES = ('s', 't', 'a', 'e')  # the death causes, in the order of their codes
+
+    def __init__(self, names):
+        """
+        Creates the empty columns
+
+        :param names: the names of the numeric genes
+        :type names: iterable
+        """
+        self.names = tuple(names)
+        self.size = 0  # number of rows used
+        self.cols = {'birth': numpy.empty(0, dtype=numpy.int64), 'death': numpy.empty(0, dtype=numpy.int64),
+                     'cause': numpy.empty(0, dtype=numpy.int8)}
+        for name in self.names:
+            self.cols[name] = numpy.empty(0)
+        self.sorted = None  # (births, rows) of the rows sorted by birth tick, as long as no row is added
+
+    def append(self, birth, death, cause, values):
+        """
+        Adds the lives of many dead creatures
+
+        :param birth: the birth ticks
+        :type birth: list
+        :param death: the death ticks
+        :type death: list
+        :param cause: the death causes
+        :type cause: list
+        :param values: the list of the phenotypes of every numeric gene, by name
+        :type values: dict
+        :return:
+        """
+        start, end = self.size, self.size + len(birth)
+        if end > len(self.cols['birth']):
+            self._grow(max(self.BLOCK, 2 * end))
+        cols = self.cols
+        cols['birth'][start:end] = birth
+        cols['death'][start:end] = death
+        cols['cause'][start:end] = [self.CAUSES.index(i) for i in cause]
+        for name in self.names:
+            cols[name][start:end] = values[name]
+        self.size = end
+        self.sorted = None
+
+    def _grow(self, capacity):
+        """
+        Enlarges the columns
+
+        :param capacity: the new number of rows
+        :type capacity: int
+        :return:
+        """
+        for name in self.cols:
+            col = numpy.empty(capacity, dtype=self.cols[name].dtype)
+            col[:self.size] = self.cols[name][:self.size]
+            self.cols[name] = col
+
+    def alive(self, tick):
+        """
+        Gets the creatures alive in a tick, born in it or before and dead in it or after
+
+        :param tick: the tick
+        :type tick: int
+        :return: the array of the rows of the creatures
+        """
+        if self.sorted is None:
+            births = self.cols['birth'][:self.size]
+            rows = numpy.argsort(births, kind='stable')
+            self.sorted = (births[rows], rows)
+        births, rows = self.sorted
+        rows = rows[:numpy.searchsorted(births, tick, 'right')]
+        return rows[self.cols['death'][rows] >= tick]
+
+    def values(self, name, rows):
+        """
+        Gets the phenotypes of a numeric gene of the creatures
+
+        :param name: the name of the gene
+        :type name: str
+        :param rows: the rows of the creatures
+        :type rows: numpy.ndarray
+        :return: the array of the phenotypes
+        """
+        return self.cols[name][rows]
+
+    def changes(self, interval, number):
+        """
+        Counts the births and the deaths by cause in consecutive windows of ticks, starting from the tick 0
+
+        :param interval: the ticks of a window
+        :type interval: int
+        :param number: the number of windows
+        :type number: int
+        :return: the array of the births and the matrix of the deaths with a row for every cause, a column for every window
+        """
+        cols = self.cols
+        births = cols['birth'][:self.size]
+        births = numpy.bincount(births[births >= 0] // interval, minlength=number)[:number]
+        windows = cols['death'][:self.size] // interval
+        counted = windows < number
+        deaths = numpy.zeros((len(self.CAUSES), number), dtype=numpy.int64)
+        numpy.add.at(deaths, (cols['cause'][:self.size][counted], windows[counted]), 1)
+        return births, deaths
+
+
+class CreatureArchive(object):
+    """
+    class of the writer of the data of the creatures died: the data of every creature is converted to strings
+    when it dies, so that the creature is released, and it is written to file in groups of BUFFER
+    with the states taken out of the TrajectoryStore. The lives are added to the IntervalIndex
+    """
+    BUFFER = 4096  # number of creatures written together
+
+    def __init__(self, path, trajectories, intervals, rounding):
+        """
+        Opens the file of the creatures
+
+        :param path: the path of the file
+        :type path: str
+        :param trajectories: the states of the creatures
+        :type trajectories: TrajectoryStore
+        :param intervals: the index of the lives of the creatures, None not to keep them
+        :type intervals: IntervalIndex
+        :param rounding: decimal places of rounding
+        :type rounding: int
+        """
+        self.file = open(path, 'w')
+        self.trajectories = trajectories
+        self.intervals = intervals
+        self.rounding = rounding
+        self.pending = list()  # (ID, data) of the creatures died, not yet written
+        self.lives = self._lives_new()  # lives of the creatures died, not yet added to the index
+
+    def _lives_new(self):
+        """
+        Creates the empty lists of the lives of the creatures
+
+        :return: dictionary with a list for every column of the IntervalIndex
+        """
+        if self.intervals is None:
+            return None
+        return {name: list() for name in ('birth', 'death', 'cause') + self.intervals.names}
+
+    def add(self, creatures):
+        """
+        Adds creatures died, which are written when they are BUFFER
+
+        :param creatures: the creatures died
+        :type creatures: iterable
+        :return:
+        """
+        lives = self.lives
+        for creature in creatures:
+            self.pending.append((creature.ID, creature.end()))
+            if lives is not None:
+                lives['birth'].append(creature.birth_tick)
+                lives['death'].append(creature.death_tick)
+                lives['cause'].append(creature.death_cause)
+                genes = creature.genes
+                for name in self.intervals.names:
+                    lives[name].append(genes[name].phenotype)
+        if len(self.pending) >= self.BUFFER:
+            self.flush()
+
+    def flush(self):
+        """
+        Writes the creatures died not yet written
+
+        :return:
+        """
+        if not self.pending:
+            return
+        histories = self.trajectories.release([key for key, data in self.pending])
+        for key, data in self.pending:
+            history = utl.add_to_write(histories[key], self.rounding)
+            self.file.write(''.join(history if i is None else i for i in data)[:-1] + '\n')
+        if self.lives is not None:
+            lives = self.lives
+            self.intervals.append(lives['birth'], lives['death'], lives['cause'],
+                                  {name: lives[name] for name in self.intervals.names})
+            self.lives = self._lives_new()
+        self.pending = list()
+
+    def close(self):
+        """
+        Writes the creatures left and closes the file
+
+        :return:
+        """
+        self.flush()
+        self.file.close()
@@ -0,0 +1,58 @@
+"""
+this module contains the class Scheduler, the calendar of the events of the simulation.
+The deadlines known in advance (as the death by age) are scheduled once instead of being checked every tick
+"""
+
+
+class Scheduler(object):
+    """
+    class of the calendar of the events, by tick
+    """
+
+    def __init__(self):
+        """
+        Creates an empty calendar
+        """
+        self.calendar = dict()  # tick: dictionary of number of the event: (function, args)
+        self.count = 0  # number of the last event scheduled
+
+    def schedule(self, tick, function, *args):
+        """
+        Schedules the call of the function in the tick given
+
+        :param tick: the tick of the event
+        :type tick: int
+        :param function: the function to call
+        :type function: function
+        :param args: the arguments of the function
+        :return: the event, to cancel it
+        """
+        self.count += 1
+        self.calendar.setdefault(tick, dict())[self.count] = (function, args)
+        return tick, self.count
+
+    def cancel(self, event):
+        """
+        Removes an event from the calendar, if it has not been run yet
+
+        :param event: the event returned by schedule
+        :type event: tuple
+        :return:
+        """
+        tick, number = event
+        events = self.calendar.get(tick)
+        if events is not None:
+            events.pop(number, None)
+            if not events:
+                del self.calendar[tick]
+
+    def run(self, tick):
+        """
+        Calls the functions of the events of the tick, in the order they have been scheduled
+
+        :param tick: the tick
+        :type tick: int
+        :return:
+        """
+        for function, args in self.calendar.pop(tick, dict()).values():
+            function(*args)
@@ -0,0 +1,443 @@
+"""
+this module contains the class SpatialIndex which counts the creatures in every chunk
+so that the creatures can query their view without iterating over the creatures in it,
+the class MateRegistry which keeps the creatures ready to reproduce in every chunk,
+the class PreyIndex which keeps the best prey of every chunk for the carnivores,
+the class PredatorMap which tells the herbivores where the carnivores they see are
+and the class ViewKernel which chooses the chunk to go to for many herbivores together
+"""
+
+import numpy
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+class SpatialIndex(object):
+    """
+    class of the index of the creatures per chunk, by diet, sex and reproduction readiness
+    """
+    DIETS = ('H', 'C')
+
+    def __init__(self, width, height):
+        """
+        Creates an empty index
+
+        :param width: number of chunks in the first coordinate
+        :type width: int
+        :param height: number of chunks in the second coordinate
+        :type height: int
+        """
+        self.width = width
+        self.height = height
+        self.counts = numpy.zeros((width, height, len(self.DIETS), 2, 2), dtype=numpy.int64)  # x, y, diet, sex, ready
+        self.predators = None  # PredatorMap of the carnivores, built at the first query
+
+    def _key(self, creature, ready=None):
+        """
+        Gets the diet, sex and readiness indexes of the creature
+
+        :param creature: the creature
+        :type creature: Creature
+        :param ready: the readiness to consider instead of the one of the creature
+        :type ready: bool
+        :return: tuple
+        """
+        if ready is None:
+            ready = creature.reprod_ready
+        return self.DIETS.index(creature.diet), creature.sex, int(ready)
+
+    def add(self, creature, x, y):
+        """
+        Adds the creature to the chunk (x, y)
+
+        :return:
+        """
+        self.counts[(x, y) + self._key(creature)] += 1
+        self._predators_update(creature, x, y)
+
+    def remove(self, creature, x, y):
+        """
+        Removes the creature from the chunk (x, y)
+
+        :return:
+        """
+        self.counts[(x, y) + self._key(creature)] -= 1
+        self._predators_update(creature, x, y)
+
+    def move(self, creature, old, new):
+        """
+        Moves the creature from the chunk old to the chunk new
+
+        :param old: the coordinates of the chunk the creature leaves
+        :type old: tuple
+        :param new: the coordinates of the chunk the creature reaches
+        :type new: tuple
+        :return:
+        """
+        key = self._key(creature)
+        self.counts[tuple(old) + key] -= 1
+        self.counts[tuple(new) + key] += 1
+        self._predators_update(creature, *old)
+        self._predators_update(creature, *new)
+
+    def _predators_update(self, creature, x, y):
+        """
+        Updates the PredatorMap if the carnivores have entered or left the chunk (x, y)
+
+        :return:
+        """
+        if self.predators is not None and creature.diet == self.DIETS[1]:
+            present = self.counts[x, y, 1].any()
+            if present != self.predators.presence[x, y]:
+                self.predators.set(x, y, present)
+
+    def predator_map(self, ray):
+        """
+        Gets the PredatorMap of the carnivores in the index, which is kept up to date once built
+
+        :param ray: the view ray
+        :type ray: int
+        :return: PredatorMap
+        """
+        if self.predators is None:
+            self.predators = PredatorMap(self.counts[:, :, 1].sum(axis=(2, 3)) > 0, ray)
+        return self.predators
+
+    def ready_set(self, creature, x, y, ready):
+        """
+        Moves the creature in the chunk (x, y) to its new reproduction readiness
+
+        :param ready: the new readiness
+        :type ready: bool
+        :return:
+        """
+        self.counts[(x, y) + self._key(creature, not ready)] -= 1
+        self.counts[(x, y) + self._key(creature, ready)] += 1
+
+    def count(self, x, y, diet=slice(None), sex=slice(None), ready=slice(None)):
+        """
+        Counts the creatures in the chunk (x, y) with the diet, the sex and the readiness given (all by default)
+
+        :param diet: 'H' or 'C'
+        :type diet: str
+        :param sex: 0 or 1
+        :type sex: int
+        :param ready: True or False
+        :type ready: bool
+        :return: int
+        """
+        return int(self.counts[x, y][self._selection(diet, sex, ready)].sum())
+
+    def window(self, x, y, ray, diet=slice(None), sex=slice(None), ready=slice(None)):
+        """
+        Counts the creatures in every chunk in the view of the chunk (x, y)
+
+        :param ray: the view ray
+        :type ray: int
+        :return: the array of the counts and the coordinates of its first chunk
+        """
+        x0 = max(x - ray, 0)
+        y0 = max(y - ray, 0)
+        window = self.counts[x0:min(x + ray + 1, self.width), y0:min(y + ray + 1, self.height)]
+        window = window[(slice(None), slice(None)) + self._selection(diet, sex, ready)]
+        if window.ndim > 2:
+            window = window.sum(axis=tuple(range(2, window.ndim)))
+        return window, (x0, y0)
+
+    def first(self, x, y, ray, **kwargs):
+        """
+        Finds the first chunk in the view of the chunk (x, y), scanning it as the creatures do, with some creatures
+        of the diet, the sex and the readiness given
+
+        :return: the coordinates of the chunk or None
+        """
+        window, origin = self.window(x, y, ray, **kwargs)
+        found = numpy.flatnonzero(window)
+        if len(found) == 0:
+            return None
+        i, j = divmod(int(found[0]), window.shape[1])
+        return origin[0] + i, origin[1] + j
+
+    def nonempty(self, x, y, ray, **kwargs):
+        """
+        Lists the chunks in the view of the chunk (x, y), in the order the creatures scan them, with some creatures
+        of the diet, the sex and the readiness given
+
+        :return: list of the coordinates of the chunks
+        """
+        window, origin = self.window(x, y, ray, **kwargs)
+        return [(origin[0] + i, origin[1] + j) for i, j in zip(*numpy.nonzero(window))]
+
+    def _selection(self, diet, sex, ready):
+        """
+        Converts the diet, the sex and the readiness into indexes of counts
+
+        :return: tuple
+        """
+        if not isinstance(diet, slice):
+            diet = self.DIETS.index(diet)
+        if not isinstance(ready, slice):
+            ready = int(ready)
+        return diet, sex, ready
+
+
+class MateRegistry(object):
+    """
+    class of the creatures ready to reproduce in every chunk, by diet and sex.
+    Every bucket is a dict used as a set which keeps the order the creatures got ready in.
+    The negative coordinates of the creatures out of the world are the chunks at the other end, as in the chunk_list
+    """
+
+    def __init__(self, width, height):
+        """
+        Creates an empty registry
+
+        :param width: number of chunks in the first coordinate
+        :type width: int
+        :param height: number of chunks in the second coordinate
+        :type height: int
+        """
+        self.width = width
+        self.height = height
+        self.buckets = dict()  # (x, y, diet, sex): {creature: None}
+
+    def add(self, creature, x, y):
+        """
+        Adds the creature to the chunk (x, y)
+
+        :return:
+        """
+        self.buckets.setdefault((x % self.width, y % self.height, creature.diet, creature.sex), dict())[creature] = None
+
+    def remove(self, creature, x, y):
+        """
+        Removes the creature from the chunk (x, y)
+
+        :return:
+        """
+        key = (x % self.width, y % self.height, creature.diet, creature.sex)
+        del self.buckets[key][creature]
+        if not self.buckets[key]:
+            del self.buckets[key]
+
+    def move(self, creature, old, new):
+        """
+        Moves the creature from the chunk old to the chunk new
+
+        :param old: the coordinates of the chunk the creature leaves
+        :type old: tuple
+        :param new: the coordinates of the chunk the creature reaches
+        :type new: tuple
+        :return:
+        """
+        self.remove(creature, *old)
+        self.add(creature, *new)
+
+    def first(self, x, y, diet, sex):
+        """
+        Gets the first creature of the diet and the sex given ready to reproduce in the chunk (x, y)
+
+        :return: the creature or None
+        """
+        bucket = self.buckets.get((x, y, diet, sex))
+        if not bucket:
+            return None
+        return next(iter(bucket))
+
+
+class PreyIndex(object):
+    """
+    class of the herbivore with the most energy in every chunk, the only prey a carnivore considers there.
+    It is built again at the beginning of every tick with one pass over the live creatures, O(N) like the tick itself,
+    and within the tick it is only repaired: the chunks whose best prey has died or left are searched again.
+    The index may then be stale during the tick, the energies compared are the ones at the beginning of the tick
+    and a herbivore which enters a chunk or gains energy does not replace the best prey there until the next tick
+    """
+
+    def __init__(self, world):
+        """
+        Creates an empty index
+
+        :param world: the world of the creatures
+        :type world: World
+        """
+        self.world = world
+        self.best = dict()  # (x, y): herbivore
+
+    def build(self, creatures):
+        """
+        Finds the best prey of every chunk, discarding the index of the last tick
+
+        :param creatures: the live creatures
+        :type creatures: set
+        :return:
+        """
+        self.best = dict()
+        width, height = self.world.coords_limits
+        for creature in creatures:
+            if creature.diet == SpatialIndex.DIETS[0]:
+                # wrapped as the grid of the chunks does for the creatures outside the map
+                chunk = (creature.chunk_coord(0) % width, creature.chunk_coord(1) % height)
+                if chunk not in self.best or creature.energy > self.best[chunk].energy:
+                    self.best[chunk] = creature
+
+    def prey(self, x, y):
+        """
+        Gets the best prey in the chunk (x, y)
+
+        :return: the herbivore or None
+        """
+        creature = self.best.get((x, y))
+        chunk_set = self.world.chunk_list[x][y].chunk_creature_set
+        if creature is None or creature not in chunk_set:
+            creature = None
+            for other in chunk_set:
+                if other.diet == SpatialIndex.DIETS[0] and (creature is None or other.energy > creature.energy):
+                    creature = other
+            self.best[(x, y)] = creature
+        return creature
+
+
+class PredatorMap(object):
+    """
+    class of the map of the chunks with carnivores in view.
+    For every chunk it stores the carnivore chunk a herbivore there runs away from,
+    the first one it meets scanning its view as Herbivore._dest_calc does
+    """
+
+    def __init__(self, presence, ray):
+        """
+        Builds the map
+
+        :param presence: grid with True in the chunks with carnivores
+        :type presence: numpy.ndarray
+        :param ray: the view ray
+        :type ray: int
+        """
+        self.ray = ray
+        self.width, self.height = presence.shape
+        # presence with a margin of two rays, so that the views of the chunks of any block of the map are in it
+        self.padded = numpy.zeros((self.width + 4 * ray, self.height + 4 * ray), dtype=numpy.bool_)
+        self.presence = self.padded[2 * ray:2 * ray + self.width, 2 * ray:2 * ray + self.height]
+        self.presence[:] = presence
+        self.near = numpy.zeros(presence.shape, dtype=numpy.bool_)
+        self.source_x = numpy.zeros(presence.shape, dtype=numpy.int64)
+        self.source_y = numpy.zeros(presence.shape, dtype=numpy.int64)
+        self._compute(0, self.width, 0, self.height)
+
+    def _compute(self, x0, x1, y0, y1):
+        """
+        Computes the map in the block of chunks from (x0, y0) included to (x1, y1) excluded
+
+        :return:
+        """
+        ray = self.ray
+        side = 2 * ray + 1
+        region = self.padded[x0 + ray:x1 + 3 * ray, y0 + ray:y1 + 3 * ray]  # the views of the chunks of the block
+
+        # chunks with carnivores in the window of every column, then the first row of the window with one
+        columns = sliding_window_view(region, side, axis=1)  # x - x0 + ray, y - y0, column of the window
+        windows = sliding_window_view(columns.any(axis=2), side, axis=0)  # x - x0, y - y0, row of the window
+        self.near[x0:x1, y0:y1] = windows.any(axis=2)
+        source_x = numpy.arange(x0, x1)[:, None] + windows.argmax(axis=2) - ray
+        self.source_x[x0:x1, y0:y1] = source_x
+
+        # first column with a carnivore in that row of the window
+        first = columns[source_x - x0 + ray, numpy.arange(y1 - y0)].argmax(axis=2)
+        self.source_y[x0:x1, y0:y1] = numpy.arange(y0, y1) + first - ray
+
+    def set(self, x, y, present):
+        """
+        Sets if there are carnivores in the chunk (x, y) and updates the chunks which see it
+
+        :param present: True if there are carnivores
+        :type present: bool
+        :return:
+        """
+        x %= self.width
+        y %= self.height
+        self.presence[x, y] = present
+        self._compute(max(x - self.ray, 0), min(x + self.ray + 1, self.width),
+                      max(y - self.ray, 0), min(y + self.ray + 1, self.height))
+
+    def flee(self, x, y):
+        """
+        Gets the chunk with the carnivore a herbivore in the chunk (x, y) runs away from
+
+        :return: the coordinates of the chunk or None
+        """
+        if x < 0 or y < 0:  # creatures out of the map see the chunks of their clipped view
+            x0 = max(x - self.ray, 0)
+            y0 = max(y - self.ray, 0)
+            window = self.presence[x0:min(x + self.ray + 1, self.width), y0:min(y + self.ray + 1, self.height)]
+            found = numpy.flatnonzero(window)
+            if len(found) == 0:
+                return None
+            i, j = divmod(int(found[0]), window.shape[1])
+            return x0 + i, y0 + j
+        if not self.near[x, y]:
+            return None
+        return int(self.source_x[x, y]), int(self.source_y[x, y])
+
+
+class ViewKernel(object):
+    """
+    class of the offsets of the chunks in the view, in the order the creatures scan them,
+    which evaluates the convenience of all the chunks in the view of many herbivores together
+    """
+
+    def __init__(self, ray, width, height, dim):
+        """
+        Precomputes the offsets of the view
+
+        :param ray: the view ray
+        :type ray: int
+        :param width: number of chunks in the first coordinate
+        :type width: int
+        :param height: number of chunks in the second coordinate
+        :type height: int
+        :param dim: the side of a chunk
+        :type dim: int
+        """
+        self.width = width
+        self.height = height
+        self.dim = dim
+        offset_x, offset_y = numpy.mgrid[-ray:ray + 1, -ray:ray + 1]
+        self.offset_x = offset_x.reshape(-1)
+        self.offset_y = offset_y.reshape(-1)
+
+    def food_dest(self, world, x, y, coord_x, coord_y, bigness, speed, energy):
+        """
+        Finds for every herbivore the chunk in its view with the most food net of the energy needed to reach it,
+        the first one in scan order in case of tie, as Herbivore._dest_calc does
+
+        :param world: the world with the food
+        :type world: World
+        :param x: first chunk coordinate of the herbivores
+        :type x: numpy.ndarray
+        :param y: second chunk coordinate of the herbivores
+        :type y: numpy.ndarray
+        :param coord_x: first coordinate of the herbivores
+        :type coord_x: numpy.ndarray
+        :param coord_y: second coordinate of the herbivores
+        :type coord_y: numpy.ndarray
+        :param bigness: bigness of the herbivores
+        :type bigness: numpy.ndarray
+        :param speed: speed of the herbivores
+        :type speed: numpy.ndarray
+        :param energy: energy of the herbivores
+        :type energy: numpy.ndarray
+        :return: the coordinates of the chunks and True where the view of the herbivore is not empty
+        """
+        c_vars = world.creatures_vars
+        i = x[:, None] + self.offset_x
+        j = y[:, None] + self.offset_y
+        valid = (i >= 0) & (i < self.width) & (j >= 0) & (j < self.height)
+        food = world.food_now(numpy.where(valid, i * self.height + j, 0))
+        # same operations in the same order of the scalar code, for the same rounding
+        value = (food * bigness[:, None] * c_vars['eat_coeff'] * c_vars['en_inc_coeff'] -
+                 (numpy.sqrt((i * self.dim + 5 - coord_x[:, None]) ** 2 + (j * self.dim + 5 - coord_y[:, None]) ** 2) /
+                  speed[:, None]) * c_vars['en_dec_coeff'] * energy[:, None])
+        value[~valid] = float("-inf")
+        best = value.argmax(axis=1)
+        rows = numpy.arange(len(x))
+        return i[rows, best], j[rows, best], valid.any(axis=1)
@@ -0,0 +1,70 @@
+"""
+this module contains the class RandomStream, a source of random numbers for a phase of the simulation.
+Every World has a stream for every phase, all of them created from the seed of the simulation,
+so that two simulations with the same seed and parameters are the same
+"""
+
+import numpy
+
+PHASES = ('setup', 'death', 'birth', 'movement')  # the phases with a stream
+
+
+def streams_create(seed):
+    """
+    Creates the streams of all the phases from the seed
+
+    :param seed: the seed of the simulation
+    :type seed: int
+    :return: dictionary with the stream of every phase
+    """
+    sequences = numpy.random.SeedSequence(seed).spawn(len(PHASES))
+    return {phase: RandomStream(sequence) for phase, sequence in zip(PHASES, sequences)}
+
+
+class RandomStream(object):
+    """
+    class of a stream of random numbers. The single numbers are taken from blocks drawn together,
+    the arrays are drawn directly from the generator
+    """
+    BLOCK = 4096  # numbers drawn together
+
+    def __init__(self, seed_sequence):
+        """
+        Creates the generator of the stream
+
+        :param seed_sequence: the seed of the generator
+        :type seed_sequence: numpy.random.SeedSequence
+        """
+        self.generator = numpy.random.Generator(numpy.random.PCG64(seed_sequence))
+        self.uniform = list()
+        self.uniform_index = 0
+        self.normal = list()
+        self.normal_index = 0
+
+    def random(self):
+        """
+        Returns a random number between 0 and 1, as random.random
+
+        :return: the number
+        """
+        if self.uniform_index == len(self.uniform):
+            self.uniform = self.generator.random(self.BLOCK).tolist()
+            self.uniform_index = 0
+        self.uniform_index += 1
+        return self.uniform[self.uniform_index - 1]
+
+    def gauss(self, mu, sigma):
+        """
+        Returns a random number of the gaussian distribution given, as random.gauss
+
+        :param mu: the mean
+        :type mu: float
+        :param sigma: the standard deviation
+        :type sigma: float
+        :return: the number
+        """
+        if self.normal_index == len(self.normal):
+            self.normal = self.generator.standard_normal(self.BLOCK).tolist()
+            self.normal_index = 0
+        self.normal_index += 1
+        return mu + sigma * self.normal[self.normal_index - 1]
@@ -88,6 +88,8 @@ def get_from_string(string, keys=None, level=0):
 
     :return: the object containing the data taken from the string
     """
+    if keys == 1 and not string.strip():  # an empty list
+        return list()
     splits = string.split(var.FILE_SEPARATORS[level])
     if len(splits) == 1 and not keys == 1:
         try:
@@ -108,3 +110,46 @@ def get_from_string(string, keys=None, level=0):
             to_return[key] = get_from_string(splits[i], keys[key], level + 1)
             i += 1
     return to_return
+
+
+def sim_variables_complete(variables):
+    """
+    it adds to the variables of a simulation the ones it was saved without, with the values of var.LEGACY_SIM_VARIABLES,
+    and converts the analysis tick_interval of the old simulations into the recording intervals,
+    with the trajectories and the food history recorded every tick as they were
+
+    :param variables: the variables of a template or of a simulation
+    :type variables: dict
+
+    :return: the variables completed
+    """
+    def complete(obj, defaults):
+        to_return = dict(obj)
+        for key in defaults:
+            if type(defaults[key]) == dict:
+                to_return[key] = complete(to_return.get(key, dict()), defaults[key])
+            elif key not in to_return:
+                to_return[key] = defaults[key]
+        return to_return
+
+    variables = complete(variables, var.LEGACY_SIM_VARIABLES)
+    if 'tick_interval' in variables['analysis']:
+        interval = variables['analysis'].pop('tick_interval')
+        if 'recording' not in variables:
+            variables['recording'] = {'trajectories': 1, 'food_history': 1, 'occupancy': interval, 'analysis': interval}
+    return variables
+
+
+def sim_data_restore(string):
+    """
+    it takes the data of a simulation from the string of its parameters file, also if it was saved before the
+    recording intervals
+
+    :param string: string to be converted
+    :type string: str
+
+    :return: the dictionary of the data of the simulation
+    """
+    if len(string.split(var.FILE_SEPARATORS[0])) == len(var.LEGACY_TO_RECORD['simulation']):
+        return sim_variables_complete(get_from_string(string, var.LEGACY_TO_RECORD['simulation']))
+    return get_from_string(string, var.TO_RECORD['simulation'])
@@ -47,6 +47,8 @@ DEFAULT_MAP_VARIABLES = {
 
 DEFAULT_SIM_VARIABLES = {
     'max_lifetime': None,  # max lifetime in ticks
+    'columnar_engine': None,  # 1 to store the creatures as columns of NumPy arrays, 0 to use Creature objects
+    'seed': None,  # seed of the random numbers of the simulation, 0 for a new random seed
     'initial_creatures': {  # number of creatures at the start
         'herbivores': None,  # herbivores
         'carnivores': None  # carnivores
@@ -54,6 +56,7 @@ DEFAULT_SIM_VARIABLES = {
     'chunks_vars': {
         'growth_coeff': None,  # coefficient of growth of the food in the chunks
         'start_food': None,
+        'lazy_growth': None,  # 1 to grow the food of a chunk only when it is read, 0 to grow all the chunks every tick
     },
     'creatures_vars': {
         'view_ray': None,  # creatures' distance of view in chunks
@@ -76,16 +79,32 @@ DEFAULT_SIM_VARIABLES = {
         # 'predator_eat_coeff': None,  # ?
         # 'help_for_predator': None,  # ?
     },
+    'recording': {  # ticks between two records of every output, 0 to record nothing
+        'trajectories': None,  # coordinates, energy and reproduction readiness of the creatures
+        'food_history': None,  # food of the chunks
+        'occupancy': None,  # creatures in every chunk, always recorded in the ticks analysed at the end
+        'analysis': None  # ticks analysed
+    },
     'analysis': {
-        'tick_interval': None,  # tick interval between analysis
         'percentile_parts': None,  # number of percentile parts numeric genes analysis should be divided into
         'parts': None,  # number of parts spreading genes analysis should be divided into
-        'rounding': None  # decimal places of rounding
+        'rounding': None,  # decimal places of rounding
+        'online': None  # 1 to analyse the ticks during the simulation, 0 to analyse them all at the end
     }
 }
 
+# values of the variables added after the first simulations, which give the behaviour the simulations had without them.
+# The recording intervals of the templates and the simulations with analysis tick_interval are evaluated from it
+LEGACY_SIM_VARIABLES = {
+    'columnar_engine': 0,
+    'seed': 0,
+    'chunks_vars': {'lazy_growth': 0},
+    'analysis': {'online': 0}
+}
+
 CHUNK_ATTRS = ('temperature', 'foodmax')
 
+# agility, bigness and fertility can be given by many loci with gns.PolyAgility, gns.PolyBigness and gns.PolyFertility
 CREATURES_GENES = {'agility': gns.Agility, 'bigness': gns.Bigness, 'fertility': gns.Fertility,
                    'num_control': gns.NumControl, 'temp_resist': gns.TempResist, 'mndl_control': gns.MendelControl}
 CREATURES_SECONDARY_GENES = {'speed': gns.Speed}
@@ -103,6 +122,7 @@ FILE_EXTENSIONS = {'numeric_analysis': 'rsan',
                    'chunks_attribute': 'rsca',
                    'creatures_data': 'rscr',
                    'chunks_data': 'rsch',
+                   'food_history': 'npy',
                    'simulation_data': 'rssd',
                    'map_data': 'rsmd',
                    'simulation_template': 'rsst',
@@ -110,7 +130,7 @@ FILE_EXTENSIONS = {'numeric_analysis': 'rsan',
                    }
 
 TO_RECORD = {
-    'simulation': {'name': None, 'dimension': {'width': None, 'height': None}, 'lifetime': None,
+    'simulation': {'name': None, 'dimension': {'width': None, 'height': None}, 'lifetime': None, 'columnar_engine': None, 'seed': None,
                    'initial_creatures': {
                        'herbivores': None,
                        'carnivores': None
@@ -119,6 +139,7 @@ TO_RECORD = {
                    'map_rounding': None,
                    'chunks_vars': {'growth_coeff': None,
                                    'start_food': None,
+                                   'lazy_growth': None,
                                    },
                    'creatures_vars': {'view_ray': None,
                                       'en_dec_coeff': None,
@@ -139,10 +160,14 @@ TO_RECORD = {
                                       # 'predator_eat_coeff': None,
                                       # 'help_for_predator': None,
                                       },
-                   'analysis': {'tick_interval': None,
-                                'percentile_parts': None,
+                   'recording': {'trajectories': None,
+                                 'food_history': None,
+                                 'occupancy': None,
+                                 'analysis': None},
+                   'analysis': {'percentile_parts': None,
                                 'parts': None,
-                                'rounding': None},
+                                'rounding': None,
+                                'online': None},
                    'ID_count': None},
     'creature': {'ID': None, 'birth_tick': None, 'parents_ID': None, 'sex': None, 'diet': None,
                  'genes': {'agility': None,
@@ -154,12 +179,49 @@ TO_RECORD = {
                            'speed': None
                            },
                  'death_tick': None, 'death_cause': None, 'tick_history': 1},
-    'chunk': {'coord': None, 'foodmax': None, 'growth_rate': None, 'temperature': None, 'food_history': 1},
+    'chunk': {'coord': None, 'foodmax': None, 'growth_rate': None, 'temperature': None},
     'map': {'dimension': {'width': None, 'height': None}, 'chunk_dim': None, 'map_maxes': {'foodmax': None, 'temperature': None, }, 'noises_params': {'foodmax': {'num_octaves': None, 'persistence': None, 'dimensions': None, 'noise_scale': None, }, 'temperature': {'num_octaves': None, 'persistence': None, 'dimensions': None, 'noise_scale': None}},
             'map_rounding': None},
     'map_chunk': {'x': None, 'y': None, 'foodmax': None, 'temperature': None}
 }
 
+# data of the simulations saved before the recording intervals, with the food history in the chunks
+LEGACY_TO_RECORD = {
+    'simulation': {'name': None, 'dimension': {'width': None, 'height': None}, 'lifetime': None,
+                   'initial_creatures': {
+                       'herbivores': None,
+                       'carnivores': None
+                   }, 'chunk_dim': None, 'tick_count': None,
+                   'map_maxes': {'foodmax': None, 'temperature': None, }, 'noises_params': {'foodmax': {'num_octaves': None, 'persistence': None, 'dimensions': None, 'noise_scale': None, }, 'temperature': {'num_octaves': None, 'persistence': None, 'dimensions': None, 'noise_scale': None}},
+                   'map_rounding': None,
+                   'chunks_vars': {'growth_coeff': None,
+                                   'start_food': None,
+                                   },
+                   'creatures_vars': {'view_ray': None,
+                                      'en_dec_coeff': None,
+                                      'eat_coeff': None,
+                                      'en_inc_coeff': None,
+                                      'average_age': None,
+                                      'dev_age_prob': None,
+                                      'temp_death_prob_coeff': None,
+                                      'genes_lim': {'agility': None,
+                                                    'bigness': None,
+                                                    'fertility': None,
+                                                    'num_control': None
+                                                    },
+                                      'mutation_coeff': None,
+                                      'initial_reprod_countdown': None,
+                                      'reprod_energy_dec_coeff': None,
+                                      'reprod_energy_need_coeff': None,
+                                      },
+                   'analysis': {'tick_interval': None,
+                                'percentile_parts': None,
+                                'parts': None,
+                                'rounding': None},
+                   'ID_count': None},
+    'chunk': {'coord': None, 'foodmax': None, 'growth_rate': None, 'temperature': None, 'food_history': 1},
+}
+
 # graphics
 
 
@@ -13,6 +13,7 @@ from math import ceil
 from random import randint
 from time import time
 
+import numpy
 import pygame as pyg
 
 from . import frames as frm
@@ -291,7 +292,7 @@ class SimReplayControlWindow(BaseTkWindow):
         except FileNotFoundError:
             self.destroy()
         sim_data = simulation_params.readline()
-        restored = utl.get_from_string(sim_data, var.TO_RECORD['simulation'])
+        restored = utl.sim_data_restore(sim_data)
         self.__dict__.update(restored)
 
         files = dict()
@@ -300,13 +301,17 @@ class SimReplayControlWindow(BaseTkWindow):
                 files[i] = open(os.path.join(self.directories['data'], f"{i}.{var.FILE_EXTENSIONS[i+'_data']}"))
             except FileNotFoundError:
                 self.destroy()
+        food_history = None
+        food_path = os.path.join(self.directories['data'], f"food_history.{var.FILE_EXTENSIONS['food_history']}")
+        if self.recording['food_history'] and os.path.exists(food_path):  # the old simulations have it in the chunks data
+            food_history = numpy.load(food_path, mmap_mode='r')
         self.chunk_list = []
         for line in files['chunks']:
-            self.chunk_list.append(ChunkD(line))
+            self.chunk_list.append(ChunkD(line, food_history, self.recording['food_history']))
 
         self.creature_list = set()
         for line in files['creatures']:
-            self.creature_list.add(CreaturesD(line))
+            self.creature_list.add(CreaturesD(line, self.recording['trajectories']))
 
     def update(self):
         """
@@ -559,10 +564,10 @@ class SimDiagramWindow(BaseTkWindow):
         self.TITLE = father.sim_name + ' - ' + self.subject.split('.')[0]
         self.FRAMES_TEMPLATE = {
             'diagram_canvas': (self._get_frame_class(), {'directories': father.directories, 'subject': subject, 'params': father.analysis}, {'row': 0, 'column': 0}),
-            'command_bar': (frm.DiagramCommandBar, {'windows': (self, father), 'tick_interval': father.analysis['tick_interval']}, {'row': 1, 'column': 0}), }
+            'command_bar': (frm.DiagramCommandBar, {'windows': (self, father), 'tick_interval': father.recording['analysis']}, {'row': 1, 'column': 0}), }
         super(SimDiagramWindow, self).__init__(father)
         self.__dict__.update(self.START_VARIABLES)
-        self.graph_width = father.analysis['tick_interval']
+        self.graph_width = father.recording['analysis']
         self.bind('<KeyPress>', self._get_key_event)
         self.frames_load()
 
@@ -689,7 +694,7 @@ class NewSimWindow(BaseTkWindow):
         """
         name = self.get_frame('new').load_choice.get()
         with open(os.path.join(var.SIMS_TEMPLATES_PATH, name)) as file:
-            variables = json.loads(file.readline())
+            variables = utl.sim_variables_complete(json.loads(file.readline()))
 
             def add_to_sim_variables(obj, to_add):
                 if type(to_add) == int or type(to_add) == float:
@@ -995,11 +1000,15 @@ class LoadSimProgressWindow(ProgressStatusWindow):
 
         self._progress_update('status', 'Loading chunks')
         self._progress_update('details', tuple())
+        food_history = None
+        if new_replay['recording']['food_history']:
+            food_history = numpy.load(os.path.join(new_replay['directories']['data'],
+                                                   f"food_history.{var.FILE_EXTENSIONS['food_history']}"), mmap_mode='r')
         new_replay['chunk_list'] = []
         tot_chunks = new_replay['dimension']['width'] * new_replay['dimension']['height']
         chunk = 0
         for line in files['chunks']:
-            new_replay['chunk_list'].append(ChunkD(line))
+            new_replay['chunk_list'].append(ChunkD(line, food_history, new_replay['recording']['food_history']))
             chunk += 1
             self._progress_update('details', ('creating chunks', (chunk, tot_chunks)))
             self._progress_update('percent', chunk / tot_chunks)
@@ -1010,7 +1019,7 @@ class LoadSimProgressWindow(ProgressStatusWindow):
         tot_creatures = new_replay['ID_count']
         creature = 0
         for line in files['creatures']:
-            new_replay['creature_list'].add(CreaturesD(line))
+            new_replay['creature_list'].add(CreaturesD(line, new_replay['recording']['trajectories']))
             creature += 1
             self._progress_update('details', ('creating creatures', (creature, tot_creatures)))
             self._progress_update('percent', creature / tot_creatures)
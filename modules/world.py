@@ -1,16 +1,19 @@
 import os
 import shutil
 import time
-from random import random as rnd
 
 import numpy
-import scipy
 
-from . import genes as gns
 from . import utility as utl
 from . import var
-from .chunk import Chunk
+from .chunk import Chunk, TempDeathTable
 from .creature import Herbivore, Carnivore
+from .engine import ColumnarEngine
+from .genome import Genome
+from .records import TrajectoryStore, OccupancyStore, IntervalIndex, CreatureArchive
+from .scheduler import Scheduler
+from .streams import streams_create
+from .spatial import SpatialIndex, MateRegistry, PreyIndex, ViewKernel
 
 
 class World(object):
@@ -32,16 +35,32 @@ class World(object):
         self.thr_termination = termination_event
         self.path = os.path.join(var.SIMULATIONS_PATH, name)
         self.directories = dict()
-        self.__dict__.update(sim_variables)
+        self.__dict__.update(utl.sim_variables_complete(sim_variables))
         self.tick_count = 0
         self.ID_count = 0
         # self.noises = {'foodmax': SimplexNoise(num_octaves=6, persistence=0.1, dimensions=2, noise_scale=700),
         #               'temperature': SimplexNoise(num_octaves=6, persistence=0.1, dimensions=2, noise_scale=700)}
-        self.creature_list = set()
         self.alive_creatures = set()
         self.tick_dead = set()
         self.new_born = set()
+        if not self.seed:  # a new seed, recorded with the parameters
+            self.seed = numpy.random.SeedSequence().entropy
+        self.rng = streams_create(self.seed)  # stream of random numbers of every phase
+        self.scheduler = Scheduler()
+        self.trajectories = TrajectoryStore()  # the states of the creatures in the ticks recorded
+        self.recorded = dict.fromkeys(self.recording, False)  # the outputs recorded in the current tick
+        self.engine = None
+        if self.columnar_engine:
+            self.engine = ColumnarEngine(self)
         self._directory_setup()
+        genes = dict(var.CREATURES_GENES, **var.CREATURES_SECONDARY_GENES)
+        self.num_genes = tuple(name for name, cls in genes.items() if cls.REC_TYPE == 'num')
+        self.online = bool(self.recording['analysis'] and self.analysis['online'])  # ticks analysed during the simulation
+        # the lives of the creatures died are kept only for the analysis at the end
+        self.intervals = IntervalIndex(self.num_genes) if self.recording['analysis'] and not self.online else None
+        # the creatures died are written to file and released
+        self.archive = CreatureArchive(os.path.join(self.directories['data'], f"creatures.{var.FILE_EXTENSIONS['creatures_data']}"),
+                                       self.trajectories, self.intervals, self.analysis['rounding'])
 
         with open(os.path.join(var.MAPS_PATH, self.map_name, f"params.{var.FILE_EXTENSIONS['map_data']}"), 'r') as map_file:
             map_params = map_file.readline()
@@ -52,32 +71,54 @@ class World(object):
                                range(self.dimension['width'])]
 
             self.tot_chunks = self.dimension['width'] * self.dimension['height']
+            # chunk grid: the Chunk objects are views on these arrays
+            self.foodmax = numpy.zeros(self.coords_limits)
+            self.temperature_version = 0  # number of times the temperatures have been set
+            temperature = numpy.zeros(self.coords_limits)
             chunk = 0
             for line in map_file.readlines():
                 ch_params = utl.get_from_string(line, var.TO_RECORD['map_chunk'])
-                self.chunk_list[ch_params['x']][ch_params['y']] = Chunk(self, **ch_params)
+                self.foodmax[ch_params['x'], ch_params['y']] = ch_params['foodmax']
+                temperature[ch_params['x'], ch_params['y']] = ch_params['temperature']
+                self.chunk_list[ch_params['x']][ch_params['y']] = Chunk(self, ch_params['x'], ch_params['y'])
                 chunk += 1
                 self._progress_update('details', ('creating chunks', (chunk, self.tot_chunks)))
                 self._progress_update('percent', chunk / self.tot_chunks)
-
-        tot_carnivores = self.initial_creatures['carnivores']
-        for j in range(tot_carnivores):
-            Carnivore(*self._creature_randomization())
-            self._progress_update('details', ('creating carnivores', (j, tot_carnivores)))
-            self._progress_update('percent', j / tot_carnivores)
-
-        tot_herbivores = self.initial_creatures['herbivores']
-        for j in range(tot_herbivores):
-            Herbivore(*self._creature_randomization())
-            self._progress_update('details', ('creating herbivores', (j, tot_herbivores)))
-            self._progress_update('percent', j / tot_herbivores)
-
-        for i in self.chunk_list:
-            for j in i:
-                j.tick_record()
-
-        self.creature_list = self.new_born
-        self.alive_creatures = self.new_born
+            self.temperature = temperature
+            self.food = self.foodmax * self.rng['setup'].generator.random(self.coords_limits) * self.chunks_vars['start_food']
+            self.growth_rate = self.foodmax * self.chunks_vars['growth_coeff']
+            self.lazy_growth = bool(self.chunks_vars['lazy_growth'])
+            self.growth_tick = 0  # last tick whose food growth has been applied
+            self.food_tick = numpy.zeros(self.coords_limits, dtype=numpy.int64)  # growth tick of the values in food
+            self.food_history = None
+            if self.recording['food_history']:
+                # food of every chunk in the ticks recorded, in a file mapped in memory
+                self.food_history = numpy.lib.format.open_memmap(
+                    os.path.join(self.directories['data'], f"food_history.{var.FILE_EXTENSIONS['food_history']}"), 'w+',
+                    numpy.min_scalar_type(int(self.map_maxes['foodmax'])),
+                    (self.max_lifetime // self.recording['food_history'],) + self.coords_limits)
+            self.temp_death_table = TempDeathTable(self)
+            self.spatial_index = SpatialIndex(*self.coords_limits)
+            self.occupancy = OccupancyStore(*self.coords_limits, {name: cls for name, cls in var.CREATURES_GENES.items()
+                                                                  if cls.REC_TYPE == 'spr'})
+            self.mate_registry = MateRegistry(*self.coords_limits)
+            self.prey_index = PreyIndex(self)
+            self.view_kernel = ViewKernel(self.creatures_vars['view_ray'], self.dimension['width'],
+                                          self.dimension['height'], self.chunk_dim)
+
+        self._progress_update('details', ('creating creatures',))
+        self._population_new(Carnivore, self.initial_creatures['carnivores'])
+        self._population_new(Herbivore, self.initial_creatures['herbivores'])
+
+        if self.recording['occupancy'] or (self.recording['analysis'] and not self.online):
+            self._tick_record()
+
+        self.alive_creatures = set(self.new_born)
+        if self.online:
+            self._analysis_chunk_attrs()
+            self.demographic = {'tick': 0, 'born': 0, 'deaths': dict.fromkeys(IntervalIndex.CAUSES, 0)}
+            self._demographic_count(self.new_born, ())
+            self._analysis_tick(0, self._analysis_values(self.alive_creatures), self.occupancy.count(*self._tick_occupancy()))
         self.run()
 
     def run(self):
@@ -96,8 +137,9 @@ class World(object):
         self._progress_update('status', 'Simulation ended')
         self._progress_update('eta', None)
         self._end()
-        self._progress_update('status', 'Simulation analysis')
-        self._analysis()
+        if not self.online:
+            self._progress_update('status', 'Simulation analysis')
+            self._analysis()
         self._progress_update('status', 'Drawing backgrounds')
         self._copy_backgrounds()
         self._progress_update('status', 'Cleaning up and terminating')
@@ -151,6 +193,8 @@ class World(object):
                     count += 1
                     self._progress_update('details', ('saving chunks data', (count, self.tot_chunks)))
                     self._progress_update('percent', count / self.tot_chunks)
+        if self.food_history is not None:
+            self.food_history.flush()
         tot_creatures = len(self.alive_creatures)
         count = 0
         for i in self.alive_creatures:
@@ -158,14 +202,14 @@ class World(object):
             count += 1
             self._progress_update('details', ('killing alive creatures', (count, tot_creatures)))
             self._progress_update('percent', count / tot_creatures)
-        with open(os.path.join(self.directories['data'], f"creatures.{var.FILE_EXTENSIONS['creatures_data']}"), 'w') as file:
-            tot_creatures = len(self.creature_list)
-            count = 0
-            for i in self.creature_list:
-                i.end(file)
-                count += 1
-                self._progress_update('details', ('saving creatures data', (count, tot_creatures)))
-                self._progress_update('percent', count / tot_creatures)
+        if self.online:
+            self._demographic_count((), self.alive_creatures)
+            if self.demographic['tick'] < self.lifetime:
+                self._analysis_demographic_change(self.demographic['tick'], self.demographic['born'], self.demographic['deaths'])
+        self._progress_update('details', ('saving creatures data',))
+        self.archive.add(self.alive_creatures)
+        self.archive.close()
+        self.alive_creatures = set()
 
     def _finalize(self):
         """
@@ -173,15 +217,6 @@ class World(object):
 
         :return:
         """
-
-        tot_creatures = len(self.creature_list)
-        count = 0
-        for i in self.creature_list:
-            del i
-            count += 1
-            self._progress_update('details', ('deleting creatures', (count, tot_creatures)))
-            self._progress_update('percent', count / tot_creatures)
-
         count = 0
         for i in self.chunk_list:
             for j in i:
@@ -200,31 +235,58 @@ class World(object):
             except ValueError:
                 pass
 
-    def _creature_randomization(self):
+    def _population_new(self, creature_class, number):
         """
-        Creates a tuple with random characteristics of a creatures
+        Creates the initial creatures of a class, with random characteristics drawn together
 
-        :return: tuple
+        :param creature_class: Herbivore or Carnivore
+        :type creature_class: type
+        :param number: number of creatures
+        :type number: int
+        :return:
         """
-        coord = [0, 0]
-        for i in range(2):
-            coord[i] = rnd() * self.coords_limits[i] * self.chunk_dim
-        energy = 50 + rnd() * 100
-        sex = int(rnd() * 2)
-        lims = self.creatures_vars['genes_lim']
-        genes_cls = var.CREATURES_GENES
-        genes = dict()
-        for i in genes_cls:
-            new_gene = genes_cls[i]()
-            try:
-                new_gene.randomize(lims[i])
-            except KeyError:
-                new_gene.randomize()
-            genes[i] = new_gene
-        genes['speed'] = gns.Speed({'agility': genes['agility'], 'bigness': genes['bigness']})
+        rng = self.rng['setup']
+        coord = rng.generator.random((number, 2)) * numpy.array(self.coords_limits) * self.chunk_dim
+        energy = 50 + rng.generator.random(number) * 100
+        sex = (rng.generator.random(number) * 2).astype(int)
+        start_count = (rng.generator.random(number) * (self.creatures_vars['average_age'] / 2)).astype(int)
+        if self.engine:
+            self.engine.population(creature_class.DIET, coord.tolist(), energy.tolist(), sex.tolist(), start_count.tolist())
+        else:
+            genome = Genome()
+            genome.grow(number)
+            genome.randomize(numpy.arange(number), self.creatures_vars['genes_lim'], rng)
+            for i, (start_coord, en, sx, count) in enumerate(zip(coord.tolist(), energy.tolist(), sex.tolist(), start_count.tolist())):
+                creature_class(self, start_coord, (0, 0), en, sx, genome.genes(i), count)
+
+    def _tick_record(self):
+        """
+        Records the number of creatures in every chunk, in total and by class of phenotype.
+        The ticks analysed at the end are always recorded, so that their spreading is the one of the tick
 
-        # creazione della creatura con le caratteristiche calcolate
-        return (self, coord, (0, 0), energy, sex, genes, int(rnd() * (self.creatures_vars['average_age'] / 2)))
+        :return:
+        """
+        self.occupancy.record(self.tick_count, *self._tick_occupancy())
+
+    def _tick_occupancy(self):
+        """
+        Gets the chunks of the live creatures and the classes of their phenotypes
+
+        :return: the coordinates of the chunks and the dictionary with the classes of every gene recorded by spreading
+        """
+        genes = self.occupancy.genes
+        if self.engine:
+            x, y, classes = self.engine.occupancy(genes)
+        else:
+            x, y, classes = list(), list(), {name: list() for name in genes}
+            for chunk_row in self.chunk_list:
+                for chunk in chunk_row:
+                    for creature in chunk.chunk_creature_set:
+                        x.append(chunk.coord[0])
+                        y.append(chunk.coord[1])
+                        for name, cls in genes.items():
+                            classes[name].append(cls.REC_INDEX[creature.genes[name].phenotype])
+        return x, y, classes
 
     def _update(self):
         """
@@ -233,37 +295,102 @@ class World(object):
         :return:
         """
         self.tick_count += 1
+        for i, interval in self.recording.items():
+            self.recorded[i] = bool(interval) and self.tick_count % interval == 0
         self.tick_dead = set()
         self.new_born = set()
+        self.scheduler.run(self.tick_count)
+        self.temp_death_table.update()
 
-        for i in self.alive_creatures:
-            i.update()
-
-        tick_to_record = self.tick_count % self.analysis['tick_interval'] == 0
-        for i in self.chunk_list:
-            for j in i:
-                j.update(tick_to_record)
-
-        self.creature_list = self.creature_list.union(self.new_born)
-        self.alive_creatures = self.alive_creatures.union(self.new_born)
-        self.alive_creatures = self.alive_creatures.difference(self.tick_dead)
+        if self.engine:
+            self.engine.update()
+        else:
+            self.prey_index.build(self.alive_creatures)
+            for i in self.alive_creatures:
+                i.update()
+            self.trajectories.flush()
+
+        self._chunks_update()
+        if self.recorded['occupancy'] or (self.recorded['analysis'] and not self.online):
+            self._tick_record()
+
+        self.archive.add(self.tick_dead)
+        self._population_update()
+        if self.online:
+            self._analysis_online()
+        if self.engine:
+            self.engine.release(self.tick_dead)
         self._progress_update('details', (f'tick # {self.tick_count}  -  alive: {len(self.alive_creatures)}',))
         self._progress_update('percent', self.tick_count / self.max_lifetime)
         self._progress_update('eta', (time.time() - self.start_time) / self.tick_count * (self.max_lifetime - self.tick_count))
 
-    def _tick_creature_get(self, tick):
+    def _population_update(self):
         """
-        Gets the list of the creatures alive in a certain tick
+        Adds the creatures born and removes the creatures died in the tick.
+        The set is updated in place, so the time does not depend on the number of creatures ever lived
 
-        :param tick: the tick to search
-        :type tick: int
         :return:
         """
-        l = set()
-        for i in self.creature_list:
-            if i.birth_tick <= tick <= i.death_tick:
-                l.add(i)
-        return l
+        self.alive_creatures.update(self.new_born)
+        self.alive_creatures.difference_update(self.tick_dead)
+
+    def _chunks_update(self):
+        """
+        Makes the food grow in all the chunks until it reaches foodmax and records it
+
+        :return:
+        """
+        if not self.lazy_growth:
+            self.food *= (1 + self.growth_rate)
+            numpy.minimum(self.food, self.foodmax, out=self.food)
+        self.growth_tick = self.tick_count
+        if self.recorded['food_history']:
+            self.food_history[self.tick_count // self.recording['food_history'] - 1] = self.food_now().reshape(self.coords_limits)
+
+    @property
+    def temperature(self):
+        return self._temperature
+
+    @temperature.setter
+    def temperature(self, temperature):
+        """
+        Sets the temperatures of the chunks, so that the TempDeathTable is built again.
+        The world keeps a read-only copy, so that the temperatures can not be changed in place
+        without building the table again
+        """
+        self._temperature = numpy.array(temperature, dtype=numpy.float64)
+        self._temperature.flags.writeable = False
+        self.temperature_version += 1
+
+    def food_now(self, chunks=slice(None)):
+        """
+        Gets the food in the chunks after the last growth.
+        In lazy growth mode the food stored is grown in closed form from the tick it was last changed
+
+        :param chunks: flat indexes of the chunks (all of them by default)
+        :type chunks: numpy.ndarray
+        :return: the flat array of the food in the chunks
+        """
+        food = self.food.reshape(-1)[chunks]
+        if self.lazy_growth:
+            delta = self.growth_tick - self.food_tick.reshape(-1)[chunks]
+            # exponent capped to avoid overflows, the food is at foodmax long before
+            growth = numpy.exp(numpy.minimum(delta * numpy.log1p(self.growth_rate.reshape(-1)[chunks]), 700))
+            food = numpy.minimum(self.foodmax.reshape(-1)[chunks], food * growth)
+        return food
+
+    def food_store(self, chunks, food):
+        """
+        Sets the food in the chunks after the last growth
+
+        :param chunks: flat indexes of the chunks
+        :type chunks: numpy.ndarray
+        :param food: the new values of the food
+        :type food: numpy.ndarray
+        :return:
+        """
+        self.food.reshape(-1)[chunks] = food
+        self.food_tick.reshape(-1)[chunks] = self.growth_tick
 
     def _analysis(self):
         """
@@ -271,30 +398,96 @@ class World(object):
 
         :return:
         """
+        if not self.recording['analysis']:
+            return
 
         self._progress_update('details', ('analysing chunk attributes',))
 
         self._analysis_chunk_attrs()
 
+        ticks = range(0, self.lifetime, self.recording['analysis'])
+        births, deaths = self.intervals.changes(self.recording['analysis'], len(ticks))
+        for n, tick in enumerate(ticks):
+            self._progress_update('details', ('analysing tick #', (tick, self.lifetime)))
+            self._progress_update('percent', tick / self.lifetime)
+            alive = self.intervals.alive(tick)
+            self._analysis_tick(tick, {gene: self.intervals.values(gene, alive) for gene in self.num_genes}, self.occupancy.grids(tick))
+            self._analysis_demographic_change(tick, births[n], dict(zip(IntervalIndex.CAUSES, deaths[:, n].tolist())))
+
+    def _analysis_online(self):
+        """
+        Analyses the tick just ended during the simulation, if it is a tick analysed, from the live creatures.
+        The births and the deaths are counted every tick and written when the ticks between two analysed ones end
+
+        :return:
+        """
+        tick = self.tick_count
+        if self.recorded['analysis']:
+            self._analysis_demographic_change(self.demographic['tick'], self.demographic['born'], self.demographic['deaths'])
+            self.demographic = {'tick': tick, 'born': 0, 'deaths': dict.fromkeys(IntervalIndex.CAUSES, 0)}
+            # the last tick is not analysed, as at the end
+            if self.alive_creatures and tick < self.max_lifetime:
+                self._analysis_tick(tick, self._analysis_values(self.alive_creatures | self.tick_dead),
+                                    self.occupancy.count(*self._tick_occupancy()))
+            self.occupancy.drop(tick)  # the records are not used by the analysis during the simulation
+        self._demographic_count(self.new_born, self.tick_dead)
+
+    def _analysis_values(self, creatures):
+        """
+        Gets the phenotypes of the numeric genes of the creatures
+
+        :param creatures: the creatures
+        :type creatures: iterable
+        :return: dictionary with the array of the phenotypes of every numeric gene
+        """
+        values = {gene: list() for gene in self.num_genes}
+        for creature in creatures:
+            genes = creature.genes
+            for gene in self.num_genes:
+                values[gene].append(genes[gene].phenotype)
+        return {gene: numpy.array(values[gene], dtype=numpy.float64) for gene in self.num_genes}
+
+    def _demographic_count(self, born, dead):
+        """
+        Adds the creatures born and died to the ones of the ticks since the last tick analysed
+
+        :param born: the creatures born
+        :type born: iterable
+        :param dead: the creatures died
+        :type dead: iterable
+        :return:
+        """
+        for creature in born:
+            if creature.birth_tick >= self.demographic['tick']:
+                self.demographic['born'] += 1
+        for creature in dead:
+            self.demographic['deaths'][creature.death_cause] += 1
+
+    def _analysis_tick(self, tick, values, grids):
+        """
+        Analyses the genes and the spreading of the creatures in a tick
+
+        :param tick: the tick considered
+        :type tick: int
+        :param values: the phenotypes of every numeric gene of the creatures alive in tick
+        :type values: dict
+        :param grids: the grid of the number of creatures in every chunk in tick and the grids by class of every gene
+        :type grids: tuple
+        :return:
+        """
         genes = dict()
         genes.update(var.CREATURES_GENES)
         genes.update(var.CREATURES_SECONDARY_GENES)
 
-        for tick in range(0, self.lifetime, self.analysis['tick_interval']):
-            self._progress_update('details', ('analysing tick #', (tick, self.lifetime)))
-            self._progress_update('percent', tick / self.lifetime)
-            alive = self._tick_creature_get(tick)
-
-            for gene in genes:
-                rec_type = genes[gene].REC_TYPE
-                if rec_type == 'num':
-                    self._analysis_num_gene(gene, alive, tick)
+        for gene in genes:
+            rec_type = genes[gene].REC_TYPE
+            if rec_type == 'num':
+                self._analysis_num_gene(gene, values[gene], tick)
 
-                elif rec_type == 'spr':
-                    self._analysis_spr_gene(gene, tick)
+            elif rec_type == 'spr':
+                self._analysis_spr_gene(gene, tick, grids[1][gene])
 
-            self._analysis_demographic_change(tick)
-            self._analysis_demographic_spreading(tick)
+        self._analysis_demographic_spreading(tick, grids[0])
 
     def _analysis_file_write(self, file_name, file_type, to_write, tick=None, attr=None):
         """
@@ -327,52 +520,62 @@ class World(object):
 
     def _analysis_chunk_attrs(self):
         """
-        Prints to the file the number of chunks per attribute class
+        Prints to the file the number of chunks per attribute class and evaluates the class of every chunk
 
         :return:
         """
         self.chunk_attrs_freq = dict()
+        self.chunk_bins = dict()
         for attr in var.CHUNK_ATTRS:
-            values = list()
-            for chunk_row in self.chunk_list:
-                for chunk in chunk_row:
-                    values.append(chunk.__dict__[attr])
             min = 0
             if attr == 'temperature':
                 min = -self.map_maxes[attr]
-            parts = numpy.histogram(values, self.analysis['parts'], (min, self.map_maxes[attr]))[0]
+            parts = numpy.histogram(getattr(self, attr), self.analysis['parts'], (min, self.map_maxes[attr]))[0]
             self.chunk_attrs_freq[attr] = parts
+            # class of every chunk, the chunks at the maximum in the last one
+            bins = ((getattr(self, attr) - min) * self.analysis['parts'] / (self.map_maxes[attr] - min)).astype(numpy.int64)
+            self.chunk_bins[attr] = numpy.minimum(bins, self.analysis['parts'] - 1).ravel()
             self._analysis_file_write(attr, 'chunks_attribute', parts)
 
-    def _analysis_num_gene(self, gene, alive, tick):
+    def _analysis_num_gene(self, gene, values, tick):
         """
         Prints to the file the different percentile values and the average
 
         :param gene: the gene to analyse
         :type gene: str
-        :param alive: the list of alive creatures in tick
-        :type alive: set
+        :param values: the phenotypes of the gene of the creatures alive in tick
+        :type values: numpy.ndarray
         :param tick: the tick considered
         :type tick: int
         :return:
         """
-        values = list()
-        for creature in alive:
-            values.append(creature.genes[gene].phenotype)
-        parts = list()
-        for part in range(0, self.analysis['percentile_parts'] + 1):
-            parts.append(scipy.percentile(values, part * 100 / self.analysis['percentile_parts']))
-        parts.append(scipy.average(values))
+        # all the percentiles together, with the cut points evaluated as numpy.percentile does
+        cuts = numpy.arange(self.analysis['percentile_parts'] + 1) * 100 / self.analysis['percentile_parts'] / 100
+        parts = list(numpy.quantile(values, cuts))
+        parts.append(numpy.mean(values))
         self._analysis_file_write(gene, 'numeric_analysis', parts, tick)
 
-    def _get_ch_index(self, chunk, attr):
-        attr_max = self.map_maxes[attr]
-        if attr == 'temperature':
-            return int((chunk.__dict__[attr] + attr_max) * self.analysis['parts'] / (2 * attr_max))
-        else:
-            return int(chunk.__dict__[attr] * self.analysis['parts'] / attr_max)
-
-    def _analysis_spr_gene(self, gene, tick):
+    def _analysis_spreading(self, attr, grids):
+        """
+        Counts the creatures by class of the chunk attribute, as a table with a row for every grid,
+        and divides the counts by the number of chunks of every class
+
+        :param attr: the chunk attribute
+        :type attr: str
+        :param grids: the grids of the number of creatures in every chunk, one after the other
+        :type grids: numpy.ndarray
+        :return: the list of the counts and the list of the counts divided of every grid
+        """
+        parts = self.analysis['parts']
+        grids = grids.reshape(len(grids), -1)
+        indexes = numpy.arange(len(grids))[:, None] * parts + self.chunk_bins[attr]
+        values = numpy.bincount(indexes.ravel(), grids.ravel(), len(grids) * parts).astype(numpy.int64).reshape(len(grids), parts)
+        freq = self.chunk_attrs_freq[attr]
+        correct = values / numpy.where(freq == 0, 1, freq)
+        # 0 for the classes without chunks
+        return values.tolist(), [[value if f else 0 for value, f in zip(row, freq.tolist())] for row in correct]
+
+    def _analysis_spr_gene(self, gene, tick, grids):
         """
         Prints to the file the different spreading of creatures by their gene's phenotype
 
@@ -380,82 +583,36 @@ class World(object):
         :type gene: str
         :param tick: the tick considered
         :type tick: int
+        :param grids: the grids of the number of creatures in every chunk in tick, by class of phenotype
+        :type grids: numpy.ndarray
         :return:
         """
-        index = tick // self.analysis['tick_interval']
         gene_class = var.CREATURES_GENES[gene]
         attr = gene_class.REC_CHUNK_ATTR
         classes = gene_class.REC_CLASSES
-        values = [[0 for i in range(self.analysis['parts'])] for j in classes]
-        for chunk_row in self.chunk_list:
-            for chunk in chunk_row:
-                chunk_index = self._get_ch_index(chunk, attr)
-                for creature in chunk.ticks_record[index]:
-                    i = 0
-                    for phens in classes:
-                        if creature.genes[gene].phenotype in phens:
-                            phen_index = i
-                            break
-                        i += 1
-                    try:
-                        values[phen_index][chunk_index] += 1
-                    except IndexError:
-                        if chunk_index == self.analysis['parts']:
-                            values[phen_index][chunk_index - 1] += 1
-                        else:
-                            raise
-        correct = [[0 for i in range(self.analysis['parts'])] for j in classes]
+        values, correct = self._analysis_spreading(attr, grids)
         for phen in range(len(classes)):
-            for part in range(self.analysis['parts']):
-                if not self.chunk_attrs_freq[attr][part] == 0:
-                    correct[phen][part] = values[phen][part] / self.chunk_attrs_freq[attr][part]
-                else:
-                    correct[phen][part] = 0
             self._analysis_file_write(gene + '_' + classes[phen][0], 'spreading_analysis', values[phen] + correct[phen], tick, attr)
 
-    def _analysis_demographic_change(self, tick):
+    def _analysis_demographic_change(self, tick, born, deaths):
         """
         Prints to the file the number of births and deaths divided by cause
 
         :param tick: the tick considered
         :type tick: int
+        :param born: the number of births from the tick considered to the next one analysed
+        :type born: int
+        :param deaths: the number of deaths in the same ticks by cause
+        :type deaths: dict
         :return:
         """
-        deaths = {'s': 0, 't': 0, 'a': 0, 'e': 0}
-        born = 0
-        for creature in self.creature_list:
-            if tick <= creature.birth_tick < tick + self.analysis['tick_interval']:
-                born += 1
-            if tick <= creature.death_tick < tick + self.analysis['tick_interval']:
-                deaths[creature.death_cause] += 1
-        self._analysis_file_write('demographic_change', 'demographic_analysis', [born, deaths['s'], deaths['t'], deaths['a']], tick)
-
-    def _analysis_demographic_spreading(self, tick):
-        index = tick // self.analysis['tick_interval']
+        self._analysis_file_write('demographic_change', 'demographic_analysis', [int(born), deaths['s'], deaths['t'], deaths['a']], tick)
+
+    def _analysis_demographic_spreading(self, tick, grid):
         attr = 'foodmax'
-        attr_max = self.map_maxes['foodmax']
-        values = [0 for i in range(self.analysis['parts'])]
-        for chunk_row in self.chunk_list:
-            for chunk in chunk_row:
-                chunk_index = int(chunk.__dict__[attr] * self.analysis['parts'] / attr_max)
-                try:
-                    values[chunk_index] += len(chunk.ticks_record[index])
-                except IndexError:
-                    if chunk_index == self.analysis['parts']:
-                        values[chunk_index - 1] += len(chunk.ticks_record[index])
-                    else:
-                        raise
-        correct = [0 for i in range(self.analysis['parts'])]
-        for part in range(self.analysis['parts']):
-            if not self.chunk_attrs_freq[attr][part] == 0:
-                correct[part] = values[part] / self.chunk_attrs_freq[attr][part]
-            else:
-                correct[part] = 0
-        self._analysis_file_write("demographic_spreading", 'spreading_analysis', values + correct, tick, attr)
-        total = 0
-        for i in values:
-            total += i
-        self._analysis_file_write("population", 'population_analysis', (total,), tick)
+        values, correct = self._analysis_spreading(attr, grid[None])
+        self._analysis_file_write("demographic_spreading", 'spreading_analysis', values[0] + correct[0], tick, attr)
+        self._analysis_file_write("population", 'population_analysis', (sum(values[0]),), tick)
 
     def _copy_backgrounds(self):
         for attr in var.CHUNK_ATTRS:
@@ -0,0 +1,76 @@
+"""
+tests of the replay of the creatures recorded every few ticks
+"""
+
+import numpy
+import pygame as pyg
+
+from modules import utility as utl
+from modules import var
+from modules.graphics import ChunkD, CreaturesD, interpolate
+
+
+def creature_line(tick_history):
+    """
+    Writes the line of a dead creature as Creature.end does
+    """
+    data = {'ID': 1, 'birth_tick': 3, 'parents_ID': (0, 0), 'sex': 0, 'diet': 'H',
+            'genes': {'agility': 20.0, 'bigness': 40.0, 'fertility': 60.0, 'num_control': 50.0,
+                      'temp_resist': 'N', 'mndl_control': 'A', 'speed': 1.0},
+            'death_tick': 7, 'death_cause': 's', 'tick_history': tick_history}
+    to_write = str()
+    for i in var.TO_RECORD['creature']:
+        to_write += utl.add_to_write(data[i], 4)
+    return to_write[:-1] + '\n'
+
+
+def chunk_line():
+    """
+    Writes the line of a chunk as Chunk.end does
+    """
+    data = {'coord': (1, 2), 'foodmax': 80.0, 'growth_rate': 0.1, 'temperature': 10.0}
+    to_write = str()
+    for i in var.TO_RECORD['chunk']:
+        to_write += utl.add_to_write(data[i], 4)
+    return to_write[:-1] + '\n'
+
+
+def test_interpolate_empty():
+    assert interpolate([], 2.5) is None
+
+
+def test_interpolate_states():
+    assert interpolate([(0, 0), (10, 20)], 0.5) == [5, 10]
+    assert interpolate([(0, 0), (10, 20)], 3) == [10, 20]
+
+
+def test_creature_without_states():
+    creature = CreaturesD(creature_line([]), 10)
+    assert creature.tick_history == []
+    creature.draw(pyg.Surface((100, 100)), 5, 'none', 'none', 1)
+
+
+def test_creature_with_states():
+    creature = CreaturesD(creature_line([(1.5, 2.5, 80, 0), (3.5, 4.5, 60, 1)]), 1)
+    assert creature.tick_history == [[1.5, 2.5, 80, 0], [3.5, 4.5, 60, 1]]
+    creature.draw(pyg.Surface((100, 100)), 5, 'none', 'energy', 1)
+
+
+def test_chunk_with_food_history(tmp_path):
+    food_history = numpy.arange(2 * 3 * 4, dtype=numpy.float64).reshape((2, 3, 4))
+    numpy.save(tmp_path / 'food_history.npy', food_history)
+    chunk = ChunkD(chunk_line(), numpy.load(tmp_path / 'food_history.npy', mmap_mode='r'), 1)
+    chunk.draw(pyg.Surface((100, 100)), 1, 10, 1)
+    assert chunk._get_color(2).g == int(food_history[1, 1, 2] * 255 / 100)
+
+
+def test_chunk_without_food_history():
+    chunk = ChunkD(chunk_line(), None, 1)
+    chunk.draw(pyg.Surface((100, 100)), 1, 10, 1)
+
+
+def test_chunk_with_old_food_history():
+    chunk = ChunkD('0/1;55.1839;0.0166;-16.6381;4/4/5/7\n', None, 1)
+    assert chunk.coord == [0, 1]
+    assert chunk.food_history == [4, 4, 5, 7]
+    assert chunk._get_color(3).g == int(5 * 255 / 100)
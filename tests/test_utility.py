@@ -0,0 +1,34 @@
+"""
+tests of the reading of the templates and of the data of the simulations saved before the recording intervals
+"""
+
+from modules import utility as utl
+
+OLD_TEMPLATE = {"max_lifetime": 10000, "initial_creatures": {"herbivores": 300, "carnivores": 0},
+                "chunks_vars": {"growth_coeff": 0.0003, "start_food": 0.2},
+                "analysis": {"tick_interval": 100, "percentile_parts": 8, "parts": 8, "rounding": 4}}
+
+OLD_PARAMS = ('olds;60/45;30;300/0;10;30;100/100;6,0.1,2,700/6,0.1,2,700;4;0.0003/0.2;'
+              '3/0.03/0.005/2/1000/200/0.02/10|60,20|80,50|200,0|100/0.05/150/0.5/12000;100/8/8/4;307')
+
+
+def test_old_template():
+    variables = utl.sim_variables_complete(OLD_TEMPLATE)
+    assert variables['recording'] == {'trajectories': 1, 'food_history': 1, 'occupancy': 100, 'analysis': 100}
+    assert variables['analysis'] == {'percentile_parts': 8, 'parts': 8, 'rounding': 4, 'online': 0}
+    assert variables['columnar_engine'] == 0 and variables['seed'] == 0
+    assert variables['chunks_vars'] == {'growth_coeff': 0.0003, 'start_food': 0.2, 'lazy_growth': 0}
+    assert 'tick_interval' in OLD_TEMPLATE['analysis']  # the template given is not changed
+
+
+def test_new_template():
+    template = dict(OLD_TEMPLATE, columnar_engine=1, seed=7, chunks_vars={"growth_coeff": 0.0003, "start_food": 0.2, "lazy_growth": 1},
+                    recording={"trajectories": 5, "food_history": 10, "occupancy": 0, "analysis": 50},
+                    analysis={"percentile_parts": 8, "parts": 8, "rounding": 4, "online": 1})
+    assert utl.sim_variables_complete(template) == template
+
+
+def test_old_params():
+    restored = utl.sim_data_restore(OLD_PARAMS)
+    assert restored['lifetime'] == 30 and restored['ID_count'] == 307
+    assert restored['recording'] == {'trajectories': 1, 'food_history': 1, 'occupancy': 100, 'analysis': 100}